@@ -13,32 +13,80 @@ The backend integrates with existing Python modules:
 - signal_detection.py: Signal detection and summary generation
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 import pandas as pd
 import numpy as np
 import json
+import logging
+import logging.handlers
+import orjson
 import os
+import pickle
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import queue
 import sys
-from werkzeug.utils import secure_filename
-import subprocess
+import shutil
+import tempfile
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import FileTarget
 import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to Python path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 # Import project modules
-from data_processing import load_ae_data
-from signal_detection import detect_signals, generate_cluster_summaries
+from data_processing import is_parquet_current, load_ae_data, read_csv_fast, read_csv_robust, sniff_delimiter
+from embeddings import get_model as load_embedding_model, run as run_embeddings
+from clustering import run as run_clustering
+from signal_detection import detect_signals, generate_cluster_summaries, run as run_signal_detection
+
+
+# orjson options used for every JSON response
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Encodes numpy scalars and arrays natively, so results built from
+    DataFrames can be passed to jsonify without int()/float() coercion.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding
+        # them to str in dumps() only for Flask to encode them again
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
 
 # Initialize Flask application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # Set maximum upload size to 50MB
 app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024 * 1024  # 1GB max file size
 
 # Enable CORS for all origins to allow frontend access
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
+# Compress JSON responses; the record payloads are large and highly repetitive
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
+
 @app.route('/api/reset', methods=['POST'])
 def reset_data():
     """
@@ -47,11 +95,13 @@ def reset_data():
     try:
         # Define files to delete
         files_to_delete = [
-            os.path.join(app.config['UPLOAD_FOLDER'], 'sample_ae.csv'),
-            os.path.join(PROJECT_ROOT, 'embeddings.npy'),
-            os.path.join(PROJECT_ROOT, 'clusters.npy'),
-            os.path.join(PROJECT_ROOT, 'top_signals.csv'),
-            os.path.join(PROJECT_ROOT, 'metrics.json')
+            CSV_PATH,
+            PARQUET_PATH,
+            EMBEDDINGS_PATH,
+            CLUSTERS_PATH,
+            TOP_SIGNALS_PATH,
+            METRICS_PATH,
+            DETECTION_BUNDLE_PATH
         ]
         
         deleted = []
@@ -73,12 +123,19 @@ def reset_data():
 @app.after_request
 def add_header(response):
     """
-    Add headers to both force latest IE rendering engine or Chrome Frame,
-    and also to cache the rendered page for 10 minutes.
+    Set caching headers.
+    
+    Mutations and job status polls must never be cached. Other GET
+    responses may be kept by the browser but are revalidated on every use,
+    since each upload changes the results behind the same URLs; endpoints
+    that send an ETag answer those revalidations with a 304.
     """
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
+    if request.method != 'GET' or request.endpoint == 'get_status':
+        response.headers["Cache-Control"] = "no-store"
+        response.headers["Pragma"] = "no-cache"
+        response.headers["Expires"] = "0"
+    else:
+        response.headers.setdefault("Cache-Control", "private, no-cache")
     return response
 
 # Configuration
@@ -88,13 +145,229 @@ PORT = 5001  # Flask server port
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 UPLOAD_FOLDER = os.path.join(PROJECT_ROOT, 'data')
 DATA_FOLDER = UPLOAD_FOLDER
-ALLOWED_EXTENSIONS = {'csv'}
+# Dataset and pipeline output files
+CSV_PATH = os.path.join(DATA_FOLDER, 'sample_ae.csv')
+# Cleaned copy of sample_ae.csv written by load_ae_data
+PARQUET_PATH = os.path.join(DATA_FOLDER, 'sample_ae.parquet')
+EMBEDDINGS_PATH = os.path.join(PROJECT_ROOT, 'embeddings.npy')
+CLUSTERS_PATH = os.path.join(PROJECT_ROOT, 'clusters.npy')
+TOP_SIGNALS_PATH = os.path.join(PROJECT_ROOT, 'top_signals.csv')
+METRICS_PATH = os.path.join(PROJECT_ROOT, 'metrics.json')
+# Pickled detect_signals results, so a restarted server doesn't recompute them
+DETECTION_BUNDLE_PATH = os.path.join(PROJECT_ROOT, 'signals_bundle.pkl')
+ALLOWED_EXTENSIONS = {'.csv'}
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Read uploads from the request body 1MB at a time
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
 # Ensure data directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Debug logging goes through a queue so file writes happen on a background
+# thread instead of the request thread. Set APP_ENV=production to drop debug records.
+LOG_PATH = os.path.join(PROJECT_ROOT, '.cursor', 'debug.log')
+os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+_log_queue = queue.Queue(-1)
+_log_handler = logging.FileHandler(LOG_PATH)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(funcName)s: %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+logger = logging.getLogger('pharmacovigilance')
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO if os.environ.get('APP_ENV') == 'production' else logging.DEBUG)
+
+# In-memory caches of endpoint results, keyed on the mtimes of the files they were built from
+RESULT_CACHE_SIZE = 4
+_signals_cache = {}
+# Serialized response bodies of the endpoints that read pipeline output files
+_clusters_cache = {}
+_top_signals_cache = {}
+_metrics_cache = {}
+
+# Uploads are processed one at a time in the background; JOBS maps job ids
+# to their futures so /api/status can report on them
+PIPELINE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+JOBS = {}
+# Request threads add, prune and scan JOBS concurrently
+JOBS_LOCK = threading.Lock()
+# Finished jobs kept around for polling
+MAX_FINISHED_JOBS = 20
+# Load the embedding model on the pipeline worker at startup so the first
+# upload doesn't pay for it; later jobs reuse the same model instance
+PIPELINE_EXECUTOR.submit(load_embedding_model)
+# (signals_df, df_clustered) from detect_signals, keyed on the mtimes of clusters.npy and sample_ae.csv
+_detection_cache = {}
+# Parsed sample_ae.csv, keyed on its mtime so pagination doesn't re-parse the file
+_df_cache = {}
+# (delimiter, header row, row count) of sample_ae.csv, keyed on its mtime
+_csv_layout_cache = {}
+# Lowercased text of each sample_ae.csv row for /api/data/cleaned searches, keyed on its mtime
+_search_index_cache = {}
+# Memory-mapped clusters.npy, keyed on its mtime
+_cluster_labels_cache = {}
+# Rows read when checking whether the CSV header is usable
+HEADER_PROBE_ROWS = 100
+# Rows of the cleaned data searched at a time by /api/clusters/search
+SEARCH_BATCH_ROWS = 200000
+
+
+def cache_put(cache, key, value):
+    """
+    Store a value in a result cache, evicting the oldest entries (FIFO)
+    once the cache holds more than RESULT_CACHE_SIZE items.
+    
+    Args:
+        cache (dict): Cache to store into
+        key: Cache key (typically a tuple of file mtimes)
+        value: Value to store
+    """
+    cache[key] = value
+    while len(cache) > RESULT_CACHE_SIZE:
+        del cache[next(iter(cache))]
+
+
+def df_to_columns(df):
+    """
+    Pull each column of a DataFrame out as a sequence, with None in place of
+    NaN and NaT.
+    
+    Float columns are converted to object arrays with the NaNs replaced in one
+    vectorized step, so no df.where() copy of the whole frame is needed.
+    Datetime columns with NaT become datetime objects (which orjson writes
+    exactly like datetime64) with None for NaT.
+    Bool, integer, float64 and object columns are then turned into lists of
+    Python objects by numpy in C, so building rows from them doesn't box a
+    numpy scalar per value. Other dtypes stay numpy arrays, since a Python
+    float would print float32 values at float64 precision and datetimes
+    would become plain integers.
+    
+    Args:
+        df (pandas.DataFrame): Frame to convert
+    
+    Returns:
+        list: One list or numpy array per column, in column order
+    """
+    arrays = []
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if values.dtype.kind in 'fO':
+            missing = pd.isna(values)
+            if missing.any():
+                values = values.astype(object)
+                values[missing] = None
+        elif values.dtype.kind == 'M' and pd.isna(values).any():
+            # orjson can't encode NaT; via microseconds (orjson's own precision)
+            # numpy gives datetime objects, and None for NaT
+            values = values.astype('datetime64[us]').astype(object)
+        if values.dtype.kind in 'biuO' or values.dtype == np.float64:
+            values = values.tolist()
+        arrays.append(values)
+    return arrays
+
+
+def df_to_records(df):
+    """
+    Convert a DataFrame to a list of record dicts, with None in place of NaN.
+    
+    Builds the records from column arrays in a plain loop, which is several
+    times faster than df.to_dict('records').
+    
+    Args:
+        df (pandas.DataFrame): Frame to convert
+    
+    Returns:
+        list: One dict per row keyed by column name
+    """
+    columns = list(df.columns)
+    return [dict(zip(columns, row)) for row in zip(*df_to_columns(df))]
+
+
+def cached_file_response(cache, path, build, *args):
+    """
+    Return a JSON response built from a file, reusing the serialized body
+    while the file's mtime is unchanged.
+    
+    If rebuilding fails (e.g. the pipeline is rewriting the file), the last
+    body built with the same arguments is served instead.
+    
+    Args:
+        cache (dict): Result cache to use
+        path (str): File the response is built from
+        build (callable): Called as build(path, *args); returns the result to serialize
+        *args: Request parameters the result depends on
+    
+    Returns:
+        flask.Response: JSON response
+    """
+    cache_key = (os.stat(path).st_mtime_ns,) + args
+    body = cache.get(cache_key)
+    if body is None:
+        try:
+            body = orjson.dumps(build(path, *args), option=ORJSON_OPTIONS)
+        except Exception:
+            stale = [b for key, b in cache.items() if key[1:] == args]
+            if not stale:
+                raise
+            logger.exception('Rebuilding %s failed, serving the previous result', path)
+            body = stale[-1]
+        else:
+            cache_put(cache, cache_key, body)
+    return Response(body, mimetype='application/json')
+
+
+def match_substring(values, query):
+    """
+    Case-insensitive literal substring match over a column, using Arrow's
+    match_substring kernel instead of pandas' per-row regex matching.
+    
+    Args:
+        values (pandas.Series or pyarrow.Array): Column to search; non-string
+            columns are matched against their string form
+        query (str): Text to look for
+    
+    Returns:
+        numpy.ndarray: Boolean mask, False for missing values
+    """
+    if isinstance(values, pd.Series):
+        try:
+            values = pa.array(values, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Numeric or mixed-type column
+            values = pa.array(values.astype(str), type=pa.string())
+    elif not pa.types.is_string(values.type):
+        # Arrow casts the column to strings itself, one column at a time
+        values = pc.cast(values, pa.string())
+    matches = pc.match_substring(values, query, ignore_case=True)
+    return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+
+
+def file_etag(*paths):
+    """
+    Build an ETag for a response derived from the given files.
+    
+    Args:
+        *paths (str): Files the response is built from
+    
+    Returns:
+        str: Tag that changes whenever any of the files is rewritten
+    """
+    return '-'.join(str(os.stat(path).st_mtime_ns) for path in paths)
+
+
+def not_modified(etag):
+    """
+    Build an empty 304 response for a client that already has this ETag.
+    
+    Args:
+        etag (str): ETag from file_etag()
+    
+    Returns:
+        flask.Response: 304 Not Modified response
+    """
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
 
 def allowed_file(filename):
     """
@@ -106,31 +379,241 @@ def allowed_file(filename):
     Returns:
         bool: True if file extension is allowed, False otherwise
     """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename[-4:].lower() in ALLOWED_EXTENSIONS
+
+
+def receive_upload(dest_path):
+    """
+    Stream the uploaded file from the request body straight to disk.
+    
+    Bypasses Werkzeug's form parser so large CSVs are written in fixed-size
+    chunks with flat memory use. Accepts either a raw
+    application/octet-stream body (filename in the X-Filename header) or a
+    multipart/form-data body with a 'file' field.
+    
+    Args:
+        dest_path (str): Path to write the uploaded bytes to
+    
+    Returns:
+        str or None: Client-supplied filename, or None if no file was sent
+    """
+    if request.mimetype == 'application/octet-stream':
+        with open(dest_path, 'wb') as f:
+            shutil.copyfileobj(request.stream, f, length=UPLOAD_CHUNK_SIZE)
+        return request.headers.get('X-Filename', '')
+    
+    parser = StreamingFormDataParser(headers=request.headers)
+    target = FileTarget(dest_path)
+    parser.register('file', target)
+    while True:
+        chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.data_received(chunk)
+    
+    return target.multipart_filename
+
+
+def load_cached_csv(csv_path):
+    """
+    Read the dataset CSV, reusing the parsed DataFrame while the file is unchanged.
+    
+    The returned DataFrame is shared between requests and must not be modified in place.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    
+    Returns:
+        pandas.DataFrame: Parsed CSV contents
+    """
+    mtime = os.path.getmtime(csv_path)
+    df = _df_cache.get(mtime)
+    if df is None:
+        layout = get_csv_layout(csv_path)
+        if layout is None:
+            df = read_csv_robust(csv_path)
+        else:
+            # Same engine and column types as read_csv_page, so a page reads the
+            # same whether or not the whole file has been parsed before
+            sep, header_row, _, dtypes = layout
+            df = pd.read_csv(csv_path, sep=sep, engine='c', skiprows=header_row,
+                             dtype=dtypes, low_memory=False)
+        # Only the current version of the file is worth keeping
+        _df_cache.clear()
+        _df_cache[mtime] = df
+    return df
+
+
+def get_search_index(csv_path):
+    """
+    Build (once per file version) the lowercased text of each row's string
+    and datetime columns, joined with '\x01', so a search is a single
+    substring scan.
+    
+    Args:
+        csv_path (str): Path to the dataset CSV
+    
+    Returns:
+        pandas.Series: One lowercased string per row of load_cached_csv(csv_path)
+    """
+    mtime = os.path.getmtime(csv_path)
+    index = _search_index_cache.get(mtime)
+    if index is None:
+        df = load_cached_csv(csv_path)
+        # Datetimes are searched by their text, as they read in the CSV
+        text_columns = df.select_dtypes(include=['object', 'string', 'datetime', 'datetimetz']).columns
+        columns = [df[col].astype('string') for col in text_columns]
+        if columns:
+            index = columns[0].str.cat(columns[1:], sep='\x01', na_rep='').str.lower()
+        else:
+            index = pd.Series('', index=df.index, dtype='string')
+        _search_index_cache.clear()
+        _search_index_cache[mtime] = index
+    return index
+
+
+def get_cluster_labels():
+    """
+    Memory-map clusters.npy read-only (once per file version) so requests
+    share its pages instead of each loading a fresh copy of the labels.
+    
+    Returns:
+        numpy.ndarray: Cluster label of each row of the cleaned data
+    """
+    mtime = os.stat(CLUSTERS_PATH).st_mtime_ns
+    labels = _cluster_labels_cache.get(mtime)
+    if labels is None:
+        labels = np.load(CLUSTERS_PATH, mmap_mode='r', allow_pickle=False)
+        # Only the current version of the file is worth keeping
+        _cluster_labels_cache.clear()
+        _cluster_labels_cache[mtime] = labels
+    return labels
+
+
+def merge_chunk_dtypes(dtypes):
+    """
+    Work out a column's type for the whole file from the types the C engine
+    inferred for it in each chunk.
+    
+    Args:
+        dtypes (set): Types the column was parsed as, one per chunk, with None
+            standing for blanks
+    
+    Returns:
+        The column's type, or None to let each read infer it: numbers widen to
+        a common numeric type (float if there are blanks), bools with blanks
+        are left to the parser, and any other mix is kept as text
+    """
+    has_blanks = None in dtypes
+    dtypes = dtypes - {None}
+    if not dtypes:
+        return np.dtype(np.float64)
+    if all(dtype.kind in 'iuf' for dtype in dtypes):
+        return np.result_type(*dtypes, *([np.float64] if has_blanks else []))
+    if dtypes == {np.dtype(bool)}:
+        # The C engine reads bools with blanks as objects; either way they
+        # serialize the same, so there is nothing to pin
+        return None if has_blanks else np.dtype(bool)
+    if len(dtypes) == 1:
+        return next(iter(dtypes))
+    return str
 
 
-def read_csv_robust(filepath):
+def get_csv_layout(csv_path):
     """
-    Robustly read a CSV file, handling potential header issues.
-    Tries standard read first, then skips 1 row if that fails.
+    Work out how to read rows of the dataset CSV directly, cached per mtime.
+    
+    Column types are worked out over the whole file, so that a page parsed on
+    its own gets the same types as the full read in load_cached_csv.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    
+    Returns:
+        tuple or None: (sep, header_row, total_rows, dtypes), or None if the
+        file needs the Python engine and can't be read a page at a time
     """
+    mtime = os.path.getmtime(csv_path)
+    if mtime in _csv_layout_cache:
+        return _csv_layout_cache[mtime]
+    
+    # Same header handling as read_csv_robust, but only on the first rows
+    header_row = 0
     try:
-        # Try standard read with auto-separator detection
-        return pd.read_csv(filepath, sep=None, engine='python')
+        read_csv_fast(csv_path, nrows=HEADER_PROBE_ROWS)
     except Exception:
-        # If that fails (e.g. ParserError due to bad header), try skipping first row
-        try:
-            return pd.read_csv(filepath, sep=None, engine='python', skiprows=1)
-        except Exception as e:
-            # If both fail, raise the original error or the new one
-            raise e
+        header_row = 1
+    
+    sep = sniff_delimiter(csv_path, skiprows=header_row)
+    try:
+        # Count records (not lines, so quoted newlines are handled) and collect
+        # the types each column was parsed as, a chunk at a time
+        total = 0
+        chunk_dtypes = {}
+        for chunk in pd.read_csv(csv_path, sep=sep, engine='c', skiprows=header_row,
+                                 chunksize=100000):
+            total += len(chunk)
+            for col in chunk.columns:
+                values = chunk[col]
+                found = chunk_dtypes.setdefault(col, set())
+                if values.dtype.kind == 'f' and values.isna().all():
+                    found.add(None)
+                elif values.dtype == object and isinstance(values.get(values.first_valid_index()), bool):
+                    # Bools with blanks
+                    found.update((np.dtype(bool), None))
+                else:
+                    found.add(values.dtype)
+        dtypes = {}
+        for col, found in chunk_dtypes.items():
+            dtype = merge_chunk_dtypes(found)
+            if dtype is not None:
+                dtypes[col] = dtype
+        layout = (sep, header_row, total, dtypes)
+    except Exception:
+        layout = None
+    
+    _csv_layout_cache.clear()
+    _csv_layout_cache[mtime] = layout
+    return layout
+
+
+def read_csv_page(csv_path, start_idx, limit):
+    """
+    Read one page of rows from the dataset CSV.
+    
+    Slices the cached DataFrame if the file has already been parsed,
+    otherwise parses only the requested rows.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        start_idx (int): Index of the first row to return
+        limit (int): Maximum number of rows to return
+    
+    Returns:
+        tuple: (page DataFrame, total number of rows in the file)
+    """
+    df = _df_cache.get(os.path.getmtime(csv_path))
+    layout = None if df is not None else get_csv_layout(csv_path)
+    if layout is None:
+        df = load_cached_csv(csv_path) if df is None else df
+        return df.iloc[start_idx:start_idx + limit], len(df)
+    
+    sep, header_row, total, dtypes = layout
+    # Skip any lines before the header and the rows before the page; the
+    # whole-file column types keep the page consistent with load_cached_csv
+    page_df = pd.read_csv(
+        csv_path, sep=sep, engine='c', nrows=limit, dtype=dtypes,
+        skiprows=lambda i: i < header_row or header_row < i <= header_row + start_idx
+    )
+    return page_df, total
 
 
 def run_processing_pipeline(filepath):
     """
     Run the complete processing pipeline after file upload.
     
-    This function executes the full pipeline:
+    This function executes the full pipeline in-process, keeping the
+    DataFrame and embeddings in memory between stages:
     1. Data processing and cleaning
     2. Embedding generation
     3. Clustering
@@ -138,37 +621,202 @@ def run_processing_pipeline(filepath):
     
     Args:
         filepath (str): Path to the uploaded CSV file
+    
+    Returns:
+        tuple: (signals_df, df_clustered) from signal detection
     """
     try:
-        # Change to project root directory to run scripts
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        os.chdir(project_root)
-        
-        # Step 1: Data processing (handled by load_ae_data when called)
-        # The file is already saved, so load_ae_data will use it
+        # Step 1: Data processing and cleaning
+        df = load_ae_data(filepath)
         
         # Step 2: Generate embeddings
-        # Run embeddings.py script
-        subprocess.run([sys.executable, 'src/embeddings.py'], 
-                      check=True, capture_output=True)
+        embeddings = run_embeddings(df, output_path=EMBEDDINGS_PATH)
         
         # Step 3: Clustering
-        # Run clustering.py script
-        subprocess.run([sys.executable, 'src/clustering.py'], 
-                      check=True, capture_output=True)
+        # This will save clusters.npy and metrics.json
+        cluster_labels = run_clustering(embeddings, PROJECT_ROOT)
         
         # Step 4: Signal detection
-        # Run signal_detection.py script
         # This will generate top_signals.csv and update metrics.json
-        subprocess.run([sys.executable, 'src/signal_detection.py'], 
-                      check=True, capture_output=True)
+        return run_signal_detection(df, cluster_labels, PROJECT_ROOT)
         
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"Error in processing pipeline: {e}")
         raise
-    except Exception as e:
-        print(f"Unexpected error in processing pipeline: {e}")
+
+
+def save_detection_bundle(cache_key, result):
+    """
+    Pickle detect_signals results to disk along with the file versions
+    they were computed from.
+    
+    Args:
+        cache_key (tuple): mtimes of clusters.npy and sample_ae.csv
+        result (tuple): (signals_df, df_clustered) from detect_signals
+    """
+    tmp_path = None
+    try:
+        # A temporary file of its own, so concurrent writers can't interleave
+        # before it is swapped in
+        fd, tmp_path = tempfile.mkstemp(dir=PROJECT_ROOT, prefix='signals_bundle.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'key': cache_key, 'result': result}, f, protocol=5)
+        os.replace(tmp_path, DETECTION_BUNDLE_PATH)
+    except Exception:
+        # The bundle is only a shortcut; detection can always be rerun
+        logger.exception('Could not save detection bundle')
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_detection_bundle(cache_key):
+    """
+    Load pickled detect_signals results if they match the current files.
+    
+    Args:
+        cache_key (tuple): mtimes of clusters.npy and sample_ae.csv
+    
+    Returns:
+        tuple: (signals_df, df_clustered), or None if there is no usable bundle
+    """
+    try:
+        with open(DETECTION_BUNDLE_PATH, 'rb') as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.exception('Could not load detection bundle')
+        return None
+    return bundle['result'] if bundle.get('key') == cache_key else None
+
+
+def get_detection_results():
+    """
+    Run signal detection on the current dataset and cluster labels, reusing
+    the result while neither file has changed. After a restart the result
+    is read back from the bundle saved by the upload job.
+    
+    Nothing is computed while an upload is being processed, since the new
+    dataset may already be in place next to the old cluster labels. Results
+    computed here are only kept in memory; the pipeline's output files
+    (top_signals.csv and the bundle) are left to the upload job.
+    
+    The returned DataFrames are shared between requests and must not be modified in place.
+    
+    Returns:
+        tuple or None: (signals_df, df_clustered) from detect_signals, or None
+        if an upload is being processed and there is no result for the current files
+    """
+    cache_key = (os.path.getmtime(CLUSTERS_PATH), os.path.getmtime(CSV_PATH))
+    result = _detection_cache.get(cache_key)
+    if result is None:
+        result = load_detection_bundle(cache_key)
+        if result is None:
+            if is_processing():
+                return None
+            result = detect_signals(cluster_labels=get_cluster_labels(), csv_path=CSV_PATH,
+                                    save_csv=False, project_root=PROJECT_ROOT)
+        # Only the current version of the files is worth keeping
+        _detection_cache.clear()
+        _detection_cache[cache_key] = result
+    return result
+
+
+def processing_response(**empty):
+    """
+    Response for endpoints whose result isn't available until the running
+    upload job finishes.
+    
+    Args:
+        **empty: Empty result fields to include, so clients can render as usual
+    
+    Returns:
+        tuple: (JSON response, 202 status)
+    """
+    return jsonify({
+        'success': True,
+        'message': 'Processing dataset...',
+        'type': 'info',
+        'processing': True,
+        **empty
+    }), 202
+
+
+def process_upload(upload_path, filepath):
+    """
+    Background job for an accepted upload: move it into place, run the
+    pipeline and cache the resulting signals for GET /api/signals.
+    
+    Args:
+        upload_path (str): Path the upload was streamed to
+        filepath (str): Path of the dataset CSV the pipeline reads
+    
+    Returns:
+        list: Top 5 cluster summaries (same format as GET /api/signals)
+    """
+    try:
+        # Move the streamed upload into place
+        os.replace(upload_path, filepath)
+        logger.debug('File saved successfully: %s', filepath)
+        
+        # Run the complete processing pipeline
+        # This includes: data processing, embeddings, clustering, signal detection
+        logger.debug('Starting processing pipeline')
+        signals_df, df_clustered = run_processing_pipeline(filepath)
+        logger.debug('Processing pipeline completed')
+        
+        # The pipeline already ran signal detection, so reuse its in-memory results
+        summaries = generate_cluster_summaries(signals_df, df_clustered, top_n=5)
+        
+        # Serve GET /api/signals and /api/signals/summaries from this result
+        # until the files change again
+        cache_key = (os.path.getmtime(CLUSTERS_PATH), os.path.getmtime(filepath))
+        cache_put(_signals_cache, cache_key, summaries)
+        _detection_cache.clear()
+        _detection_cache[cache_key] = (signals_df, df_clustered)
+        save_detection_bundle(cache_key, (signals_df, df_clustered))
+        
+        return summaries
+    except Exception:
+        logger.exception('Processing pipeline error')
         raise
+    finally:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
+
+
+def submit_job(upload_path, filepath):
+    """
+    Queue an upload for background processing.
+    
+    Args:
+        upload_path (str): Path the upload was streamed to
+        filepath (str): Path of the dataset CSV the pipeline reads
+    
+    Returns:
+        str: Id to poll with GET /api/status?job_id=
+    """
+    job_id = uuid.uuid4().hex
+    with JOBS_LOCK:
+        # Forget the oldest finished jobs
+        finished = [old_id for old_id, future in JOBS.items() if future.done()]
+        for old_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del JOBS[old_id]
+        
+        JOBS[job_id] = PIPELINE_EXECUTOR.submit(process_upload, upload_path, filepath)
+    return job_id
+
+
+def is_processing():
+    """
+    Check whether any upload is still queued or being processed.
+    
+    Returns:
+        bool: True while a background job hasn't finished
+    """
+    with JOBS_LOCK:
+        futures = list(JOBS.values())
+    return any(not future.done() for future in futures)
 
 
 @app.route('/api/signals', methods=['GET'])
@@ -212,58 +860,44 @@ def get_signals():
     """
     try:
         # Check if required files exist
-        clusters_path = os.path.join(PROJECT_ROOT, 'clusters.npy')
-        if not os.path.exists(clusters_path):
+        if not os.path.exists(CLUSTERS_PATH):
             return jsonify({
                 'success': False,
                 'error': 'Clusters not found. Please upload and process a dataset first.'
             }), 404
         
-        csv_path = os.path.join(DATA_FOLDER, 'sample_ae.csv')
-        if not os.path.exists(csv_path):
+        if not os.path.exists(CSV_PATH):
             return jsonify({
                 'success': False,
                 'error': 'Dataset not found. Please upload a CSV file first.'
             }), 404
         
-        # Detect signals and get cluster statistics
-        # We need to ensure we run this in the project root logic
-        original_dir = os.getcwd()
-        try:
-            # Change to project root for the scripts to find their dependencies/files relative to CWD if needed
-            # Although we fixed paths, the scripts might still assume CWD for some things
-            # But let's check: detect_signals calls load_ae_data which defaults to relative 'data/...'
-            # So we MUST be in project root for that default to work, OR we pass the path.
-            # detect_signals does NOT accept args. So we must chdir.
-            os.chdir(PROJECT_ROOT)
-            
-            if 'src' not in sys.path:
-                sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
-                
-            signals_df, df_clustered = detect_signals()
+        # Clients that already hold the result for these file versions get a 304
+        etag = file_etag(CLUSTERS_PATH, CSV_PATH)
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
+        
+        # Reuse the previous result if neither input file has changed
+        cache_key = (os.path.getmtime(CLUSTERS_PATH), os.path.getmtime(CSV_PATH))
+        summaries = _signals_cache.get(cache_key)
+        if summaries is None:
+            # Detect signals and get cluster statistics
+            result = get_detection_results()
+            if result is None:
+                return processing_response(signals=[])
+            signals_df, df_clustered = result
             
             # Generate human-readable summaries for top 5 clusters
             summaries = generate_cluster_summaries(signals_df, df_clustered, top_n=5)
-        finally:
-            os.chdir(original_dir)
-        
-        # Convert summaries to JSON-serializable format
-        signals_json = []
-        for summary in summaries:
-            signals_json.append({
-                'cluster': int(summary['cluster']),
-                'frequency': int(summary['frequency']),
-                'severity': float(summary['severity']),
-                'growth_rate': float(summary['growth_rate']),
-                'signal_score': float(summary['signal_score']),
-                'top_adverse_events': summary['top_adverse_events'],
-                'summary': summary['summary']
-            })
+            
+            cache_put(_signals_cache, cache_key, summaries)
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'signals': signals_json
-        }), 200
+            'signals': summaries
+        })
+        response.set_etag(etag, weak=True)
+        return response
         
     except FileNotFoundError as e:
         return jsonify({
@@ -280,358 +914,106 @@ def get_signals():
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
     """
-    POST endpoint to upload a CSV file and trigger the processing pipeline.
+    POST endpoint to upload a CSV file and start the processing pipeline.
     
     This endpoint:
     1. Validates the uploaded file (must be CSV)
     2. Saves the file to the data/ directory
-    3. Runs the complete processing pipeline:
+    3. Queues the complete processing pipeline in the background:
        - Data cleaning and preprocessing
        - Embedding generation
        - Clustering analysis
        - Signal detection
-    4. Returns the top 5 cluster summaries
+    4. Returns a job id to poll with GET /api/status?job_id=
     
     Request:
         - Content-Type: multipart/form-data
         - Body: Form data with 'file' field containing CSV file
+        or
+        - Content-Type: application/octet-stream
+        - X-Filename header: Original name of the CSV file
+        - Body: Raw CSV bytes
     
     Returns:
         JSON response with:
-        - success (bool): Whether upload and processing were successful
+        - success (bool): Whether the upload was accepted
         - message (str): Status message
-        - signals (list): Top 5 cluster summaries (same format as GET /api/signals)
+        - job_id (str): Id of the processing job
+        - status (str): 'processing'
         - error (str): Error message if operation failed
     
     Example response:
         {
             "success": true,
-            "message": "File uploaded and processed successfully",
-            "signals": [...]
+            "message": "File uploaded successfully. Processing started.",
+            "job_id": "3f2b...",
+            "status": "processing"
         }
     """
-    # #region agent log
-    import json
-    log_path = '/Users/prasannaa/Desktop/pharmacovigilance-agent/.cursor/debug.log'
-    try:
-        with open(log_path, 'a') as f:
-            f.write(json.dumps({
-                'sessionId': 'debug-session',
-                'runId': 'upload-backend',
-                'hypothesisId': 'E',
-                'location': 'app.py:228',
-                'message': 'Upload endpoint called',
-                'data': {
-                    'method': request.method,
-                    'hasFiles': 'files' in request.__dict__,
-                    'filesKeys': list(request.files.keys()) if hasattr(request, 'files') else [],
-                    'contentType': request.content_type
-                },
-                'timestamp': int(__import__('time').time() * 1000)
-            }) + '\n')
-    except: pass
-    # #endregion
+    logger.debug('Upload endpoint called: %s', {
+        'method': request.method,
+        'contentLength': request.content_length,
+        'contentType': request.content_type
+    })
+
+    # The upload is saved as sample_ae.csv (CSV_PATH) to match the expected filename
+    # in the processing pipeline. Stream into a per-upload temporary file first so a
+    # rejected or queued upload never clobbers the dataset the current job is reading
+    upload_path = f'{CSV_PATH}.{uuid.uuid4().hex}.part'
+    accepted = False
 
     try:
+        # Stream the uploaded file to disk
+        filename = receive_upload(upload_path)
+        
         # Check if file is present in request
-        if 'file' not in request.files:
+        if filename is None:
             return jsonify({
                 'success': False,
                 'error': 'No file provided in request'
             }), 400
         
-        file = request.files['file']
-        
         # Check if file was selected
-        if file.filename == '':
+        if filename == '':
             return jsonify({
                 'success': False,
                 'error': 'No file selected'
             }), 400
         
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'upload-backend',
-                    'hypothesisId': 'F',
-                    'location': 'app.py:246',
-                    'message': 'File validation',
-                    'data': {
-                        'filename': file.filename,
-                        'isAllowed': allowed_file(file.filename),
-                        'fileSize': getattr(file, 'content_length', 'unknown')
-                    },
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
+        logger.debug('File validation: %s', {
+            'filename': filename,
+            'isAllowed': allowed_file(filename),
+            'fileSize': os.path.getsize(upload_path) if os.path.exists(upload_path) else 'unknown'
+        })
 
         # Validate file type
-        if not allowed_file(file.filename):
+        if not allowed_file(filename):
             return jsonify({
                 'success': False,
                 'error': 'Invalid file type. Only CSV files are allowed.'
             }), 400
         
-        # Secure the filename and save to data directory
-        filename = secure_filename(file.filename)
-        # Save as sample_ae.csv to match expected filename in processing pipeline
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], 'sample_ae.csv')
-        
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'upload-backend',
-                    'hypothesisId': 'G',
-                    'location': 'app.py:258',
-                    'message': 'Before file save',
-                    'data': {
-                        'filepath': filepath,
-                        'uploadFolder': app.config['UPLOAD_FOLDER'],
-                        'folderExists': os.path.exists(app.config['UPLOAD_FOLDER'])
-                    },
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-        
-        # Save the uploaded file
-        file.save(filepath)
-        
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'upload-backend',
-                    'hypothesisId': 'J',
-                    'location': 'app.py:318',
-                    'message': 'File saved successfully',
-                    'data': {'filepath': filepath, 'fileExists': os.path.exists(filepath)},
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-        
-        
-        # Run the complete processing pipeline
-        # This includes: data processing, embeddings, clustering, signal detection
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        original_dir = os.getcwd()
-        
-        try:
-            os.chdir(project_root)
-            
-            # DEBUG: Check file timestamps before processing
-            debug_files = ['data/sample_ae.csv', 'embeddings.npy', 'clusters.npy']
-            import time
-            import json
-            log_path = '/Users/prasannaa/Desktop/pharmacovigilance-agent/.cursor/debug.log'
-            
-            try:
-                pre_times = {}
-                for f in debug_files:
-                    if os.path.exists(f):
-                        pre_times[f] = os.path.getmtime(f)
-                
-                with open(log_path, 'a') as logf:
-                    logf.write(json.dumps({
-                        'sessionId': 'debug-session',
-                        'runId': 'upload-backend',
-                        'hypothesisId': 'TIMESTAMP_PRE',
-                        'message': 'File timestamps before processing',
-                        'data': pre_times,
-                        'timestamp': int(time.time() * 1000)
-                    }) + '\n')
-            except Exception as e:
-                pass
-            
-            # #region agent log
-            try:
-                with open(log_path, 'a') as f:
-                    f.write(json.dumps({
-                        'sessionId': 'debug-session',
-                        'runId': 'upload-backend',
-                        'hypothesisId': 'K',
-                        'location': 'app.py:327',
-                        'message': 'Starting processing pipeline',
-                        'data': {'projectRoot': project_root, 'currentDir': os.getcwd()},
-                        'timestamp': int(__import__('time').time() * 1000)
-                    }) + '\n')
-            except: pass
-            # #endregion
-            
-            run_processing_pipeline(filepath)
-            
-            # DEBUG: Check file timestamps after processing
-            try:
-                post_times = {}
-                for f in debug_files:
-                    if os.path.exists(f):
-                        post_times[f] = os.path.getmtime(f)
-                
-                with open(log_path, 'a') as logf:
-                    logf.write(json.dumps({
-                        'sessionId': 'debug-session',
-                        'runId': 'upload-backend',
-                        'hypothesisId': 'TIMESTAMP_POST',
-                        'message': 'File timestamps after processing',
-                        'data': post_times,
-                        'timestamp': int(time.time() * 1000)
-                    }) + '\n')
-            except Exception as e:
-                pass
-
-            # #region agent log
-            try:
-                with open(log_path, 'a') as f:
-                    f.write(json.dumps({
-                        'sessionId': 'debug-session',
-                        'runId': 'upload-backend',
-                        'hypothesisId': 'L',
-                        'location': 'app.py:335',
-                        'message': 'Processing pipeline completed',
-                        'data': {},
-                        'timestamp': int(__import__('time').time() * 1000)
-                    }) + '\n')
-            except: pass
-            # #endregion
-            # After pipeline finishes, we remain in project_root for signal detection
-            # because detect_signals needs to find clusters.npy which was just created there
-            
-            try:
-                # Add src to path if needed (it is already added at top of file, but let's be safe)
-                if 'src' not in sys.path:
-                    sys.path.append(os.path.join(os.getcwd(), 'src'))
-                    
-                signals_df, df_clustered = detect_signals()
-                summaries = generate_cluster_summaries(signals_df, df_clustered, top_n=5)
-            except Exception as signal_error:
-                # #region agent log
-                try:
-                    with open(log_path, 'a') as f:
-                        f.write(json.dumps({
-                            'sessionId': 'debug-session',
-                            'runId': 'upload-backend',
-                            'hypothesisId': 'N',
-                            'location': 'app.py:signal-error',
-                            'message': 'Signal detection error',
-                            'data': {'error': str(signal_error), 'errorType': type(signal_error).__name__},
-                            'timestamp': int(__import__('time').time() * 1000)
-                        }) + '\n')
-                except: pass
-                # #endregion
-                # Don't forget to reset CWD even if this fails
-                os.chdir(original_dir)
-                return jsonify({
-                    'success': False,
-                    'error': f'Signal detection failed: {str(signal_error)}'
-                }), 500
-                
-            # If everything succeeded, reset CWD
-            os.chdir(original_dir)
-            
-            # Convert summaries to JSON-serializable format
-            signals_json = []
-            for summary in summaries:
-                signals_json.append({
-                    'cluster': int(summary['cluster']),
-                    'frequency': int(summary['frequency']),
-                    'severity': float(summary['severity']),
-                    'growth_rate': float(summary['growth_rate']),
-                    'signal_score': float(summary['signal_score']),
-                    'top_adverse_events': summary['top_adverse_events'],
-                    'summary': summary['summary']
-                })
-            
-            return jsonify({
-                'success': True,
-                'message': 'File uploaded and processed successfully',
-                'signals': signals_json
-            }), 200
-
-        except Exception as pipeline_error:
-            # #region agent log
-            try:
-                with open(log_path, 'a') as f:
-                    f.write(json.dumps({
-                        'sessionId': 'debug-session',
-                        'runId': 'upload-backend',
-                        'hypothesisId': 'M',
-                        'location': 'app.py:pipeline-error',
-                        'message': 'Processing pipeline error',
-                        'data': {'error': str(pipeline_error), 'errorType': type(pipeline_error).__name__},
-                        'timestamp': int(__import__('time').time() * 1000)
-                    }) + '\n')
-            except: pass
-            # #endregion
-            os.chdir(original_dir)
-            return jsonify({
-                'success': False,
-                'error': f'Processing pipeline failed: {str(pipeline_error)}'
-            }), 500
-        
-        # Convert summaries to JSON-serializable format
-        signals_json = []
-        for summary in summaries:
-            signals_json.append({
-                'cluster': int(summary['cluster']),
-                'frequency': int(summary['frequency']),
-                'severity': float(summary['severity']),
-                'growth_rate': float(summary['growth_rate']),
-                'signal_score': float(summary['signal_score']),
-                'top_adverse_events': summary['top_adverse_events'],
-                'summary': summary['summary']
-            })
+        # The job moves the upload into place and runs the pipeline
+        job_id = submit_job(upload_path, CSV_PATH)
+        accepted = True
+        logger.debug('Processing job queued: %s', job_id)
         
         return jsonify({
             'success': True,
-            'message': 'File uploaded and processed successfully',
-            'signals': signals_json
-        }), 200
+            'message': 'File uploaded successfully. Processing started.',
+            'job_id': job_id,
+            'status': 'processing'
+        }), 202
         
-    except subprocess.CalledProcessError as e:
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'upload-backend',
-                    'hypothesisId': 'H',
-                    'location': 'app.py:subprocess-error',
-                    'message': 'Subprocess error',
-                    'data': {'error': str(e), 'errorType': type(e).__name__},
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-        return jsonify({
-            'success': False,
-            'error': f'Processing pipeline failed: {str(e)}'
-        }), 500
     except Exception as e:
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'upload-backend',
-                    'hypothesisId': 'I',
-                    'location': 'app.py:exception',
-                    'message': 'General exception',
-                    'data': {'error': str(e), 'errorType': type(e).__name__, 'traceback': str(__import__('traceback').format_exc())[:500]},
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
+        logger.exception('Error uploading file')
         return jsonify({
             'success': False,
             'error': f'Error uploading file: {str(e)}'
         }), 500
+    finally:
+        if not accepted and os.path.exists(upload_path):
+            os.remove(upload_path)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -652,16 +1034,63 @@ def health_check():
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """
-    Get processing status endpoint (alias for health check).
+    Get processing status endpoint.
     Frontend calls this endpoint.
     
+    Query Parameters:
+        - job_id: Id returned by POST /api/upload (optional). Without it,
+          reports whether any upload is still being processed.
+    
     Returns:
-        JSON response with status information
+        JSON response with status information; for a finished job this
+        includes its signals, or the error if the pipeline failed
     """
+    job_id = request.args.get('job_id')
+    if not job_id:
+        processing = is_processing()
+        return jsonify({
+            'message': 'Processing dataset...' if processing else 'Ready',
+            'type': 'info',
+            'processing': processing
+        }), 200
+    
+    with JOBS_LOCK:
+        future = JOBS.get(job_id)
+    if future is None:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown job: {job_id}'
+        }), 404
+    
+    if not future.done():
+        return jsonify({
+            'job_id': job_id,
+            'status': 'processing',
+            'message': 'Processing dataset...',
+            'type': 'info',
+            'processing': True
+        }), 200
+    
+    error = future.exception()
+    if error is not None:
+        return jsonify({
+            'job_id': job_id,
+            'status': 'failed',
+            'success': False,
+            'message': f'Processing pipeline failed: {str(error)}',
+            'error': f'Processing pipeline failed: {str(error)}',
+            'type': 'error',
+            'processing': False
+        }), 200
+    
     return jsonify({
-        'message': 'Ready',
-        'type': 'info',
-        'processing': False
+        'job_id': job_id,
+        'status': 'done',
+        'success': True,
+        'message': 'File uploaded and processed successfully',
+        'type': 'success',
+        'processing': False,
+        'signals': future.result()
     }), 200
 
 
@@ -671,115 +1100,89 @@ def get_cleaned_data():
     Get cleaned AE data with pagination and search.
     
     Query Parameters:
-        - page: Page number (default: 1)
-        - limit: Items per page (default: 100)
+        - page: Page number, starting at 1 (default: 1)
+        - limit: Items per page, 0 or more (default: 100)
         - search: Search query (optional)
     
     Returns:
-        JSON response with cleaned data
+        JSON response with cleaned data, or 400 for an invalid page or limit
     """
     try:
-        csv_path = os.path.join(DATA_FOLDER, 'sample_ae.csv')
-        
-        # #region agent log
-        import json
-        log_path = '/Users/prasannaa/Desktop/pharmacovigilance-agent/.cursor/debug.log'
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'get-cleaned-data',
-                    'hypothesisId': 'READ',
-                    'location': 'app.py:get_cleaned_data',
-                    'message': 'Attempting to read CSV',
-                    'data': {
-                        'csv_path': csv_path, 
-                        'exists': os.path.exists(csv_path),
-                        'params': request.args
-                    },
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-
-        if not os.path.exists(csv_path):
-            return jsonify({'data': [], 'total': 0, 'page': 1, 'limit': 100}), 200
-        
-        # Use robust reader
-        df = read_csv_robust(csv_path)
+        logger.debug('Attempting to read CSV: %s', {
+            'csv_path': CSV_PATH,
+            'exists': os.path.exists(CSV_PATH),
+            'params': request.args.to_dict()
+        })
         
-        # #region agent log
+        # Pagination; out-of-range values are rejected up front, since the
+        # cached and page-at-a-time reads would treat them differently
         try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'get-cleaned-data',
-                    'hypothesisId': 'LOAD',
-                    'location': 'app.py:get_cleaned_data',
-                    'message': 'Loaded CSV',
-                    'data': {
-                        'shape': list(df.shape),
-                        'columns': df.columns.tolist()
-                    },
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-        
-        # Apply search filter if provided
-        search = request.args.get('search', '').lower()
-        if search:
-            # Search across all string columns
-            mask = df.astype(str).apply(
-                lambda x: x.str.lower().str.contains(search, na=False)
-            ).any(axis=1)
-            df = df[mask]
+            page = int(request.args.get('page', 1))
+            limit = int(request.args.get('limit', 100))
+        except ValueError:
+            return jsonify({'error': 'page and limit must be integers'}), 400
+        if page < 1 or limit < 0:
+            return jsonify({'error': 'page must be at least 1 and limit at least 0'}), 400
+
+        if not os.path.exists(CSV_PATH):
+            return jsonify({'columns': [], 'data': [], 'total': 0, 'page': 1, 'limit': 100}), 200
         
-        # Pagination
-        page = int(request.args.get('page', 1))
-        limit = int(request.args.get('limit', 100))
         start_idx = (page - 1) * limit
         end_idx = start_idx + limit
         
-        total = len(df)
-        paginated_df = df.iloc[start_idx:end_idx].copy()
-        
-        
-        # Replace NaN with None for valid JSON serialization
-        # df.where(pd.notnull(df), None) fails to catch all NaN types in some pandas versions or mixed types
-        # Explicit replace is safer
-        paginated_df = paginated_df.replace({np.nan: None})
+        search = request.args.get('search', '')
+        if search:
+            # Use robust reader, cached across page requests
+            df = load_cached_csv(CSV_PATH)
+            
+            logger.debug('Loaded CSV: %s', {'shape': list(df.shape), 'columns': df.columns.tolist()})
+            
+            # Search across all string columns at once via the prebuilt lowercase row text
+            mask = get_search_index(CSV_PATH).str.contains(
+                search.lower(), regex=False, na=False
+            ).to_numpy(dtype=bool)
+            df = df[mask]
+            
+            total = len(df)
+            paginated_df = df.iloc[start_idx:end_idx]
+        else:
+            # Without a search only the requested page needs parsing
+            paginated_df, total = read_csv_page(CSV_PATH, start_idx, limit)
         
+        # Split orientation sends the column names once instead of in every row.
+        # Only float, object and datetime columns can hold NaN/NaT, so
+        # df_to_columns replaces it with None column by column rather than
+        # checking every value
         result = {
-            'data': paginated_df.to_dict('records'),
+            'columns': list(paginated_df.columns),
+            'data': list(zip(*df_to_columns(paginated_df))),
             'total': total,
             'page': page,
             'limit': limit
         }
 
-        # #region agent log
-        try:
-            with open(log_path, 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'get-cleaned-data',
-                    'hypothesisId': 'RET',
-                    'location': 'app.py:get_cleaned_data',
-                    'message': 'Returning data',
-                    'data': {
-                        'total': total,
-                        'returned_count': len(result['data'])
-                    },
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
+        logger.debug('Returning data: %s', {'total': total, 'returned_count': len(result['data'])})
 
         return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def build_clusters_result(path):
+    """
+    Build the /api/clusters result from top_signals.csv.
+    
+    Args:
+        path (str): Path to top_signals.csv
+    
+    Returns:
+        dict: Columns and rows in split orientation
+    """
+    df = pd.read_csv(path)
+    # Split orientation sends the column names once instead of in every row
+    return {'columns': list(df.columns), 'clusters': list(zip(*df_to_columns(df)))}
+
+
 @app.route('/api/clusters', methods=['GET'])
 def get_clusters():
     """
@@ -789,46 +1192,41 @@ def get_clusters():
         JSON response with cluster data
     """
     try:
-        csv_path = os.path.join(PROJECT_ROOT, 'top_signals.csv')
-        
-        # #region agent log
-        try:
-            with open(os.path.join(app.config['UPLOAD_FOLDER'], '..', '.cursor', 'debug.log'), 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'get_clusters',
-                    'message': 'Endpoint called',
-                    'data': {'csv_path': csv_path, 'exists': os.path.exists(csv_path)},
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
-
-        if not os.path.exists(csv_path):
-            return jsonify({'clusters': []}), 200
+        logger.debug('Get clusters called: %s', {'csv_path': TOP_SIGNALS_PATH, 'exists': os.path.exists(TOP_SIGNALS_PATH)})
+
+        if not os.path.exists(TOP_SIGNALS_PATH):
+            return jsonify({'columns': [], 'clusters': []}), 200
         
-        df = pd.read_csv(csv_path)
-        # Replace NaN with None for valid JSON serialization
-        df = df.where(pd.notnull(df), None)
-        clusters = df.to_dict('records')
+        etag = file_etag(TOP_SIGNALS_PATH)
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
         
-        return jsonify({'clusters': clusters})
+        # Reuse the previous response body if top_signals.csv has not changed
+        response = cached_file_response(_clusters_cache, TOP_SIGNALS_PATH, build_clusters_result)
+        response.set_etag(etag, weak=True)
+        return response
     except Exception as e:
-        # #region agent log
-        try:
-            with open(os.path.join(app.config['UPLOAD_FOLDER'], '..', '.cursor', 'debug.log'), 'a') as f:
-                f.write(json.dumps({
-                    'sessionId': 'debug-session',
-                    'runId': 'get_clusters',
-                    'message': 'Error',
-                    'data': {'error': str(e)},
-                    'timestamp': int(__import__('time').time() * 1000)
-                }) + '\n')
-        except: pass
-        # #endregion
+        logger.exception('Error getting clusters')
         return jsonify({'error': str(e)}), 500
 
 
+def build_top_signals_result(path, top_n):
+    """
+    Build the /api/signals/top result from top_signals.csv.
+    
+    Args:
+        path (str): Path to top_signals.csv
+        top_n (int): Number of top signals to return
+    
+    Returns:
+        dict: Top signals by signal score
+    """
+    df = pd.read_csv(path)
+    df = df.sort_values('signal_score', ascending=False)
+    # Build records straight from the column arrays, with None in place of NaN
+    return {'signals': df_to_records(df.head(top_n))}
+
+
 @app.route('/api/signals/top', methods=['GET'])
 def get_top_signals():
     """
@@ -842,18 +1240,12 @@ def get_top_signals():
     """
     try:
         top_n = int(request.args.get('top_n', 5))
-        csv_path = os.path.join(PROJECT_ROOT, 'top_signals.csv')
         
-        if not os.path.exists(csv_path):
+        if not os.path.exists(TOP_SIGNALS_PATH):
             return jsonify({'signals': []}), 200
         
-        df = pd.read_csv(csv_path)
-        df = df.sort_values('signal_score', ascending=False)
-        # Replace NaN with None for valid JSON serialization
-        df = df.where(pd.notnull(df), None)
-        top_signals = df.head(top_n).to_dict('records')
-        
-        return jsonify({'signals': top_signals})
+        # Reuse the previous response body if top_signals.csv has not changed
+        return cached_file_response(_top_signals_cache, TOP_SIGNALS_PATH, build_top_signals_result, top_n)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -873,42 +1265,47 @@ def get_cluster_summaries():
     try:
         top_n = int(request.args.get('top_n', 5))
         
-        top_n = int(request.args.get('top_n', 5))
-        
         # Check if required files exist
-        clusters_path = os.path.join(PROJECT_ROOT, 'clusters.npy')
-        if not os.path.exists(clusters_path):
+        if not os.path.exists(CLUSTERS_PATH):
             return jsonify({
                 'success': False,
                 'error': 'Clusters not found. Please upload and process a dataset first.'
             }), 404
         
-        csv_path = os.path.join(DATA_FOLDER, 'sample_ae.csv')
-        if not os.path.exists(csv_path):
+        if not os.path.exists(CSV_PATH):
             return jsonify({
                 'success': False,
                 'error': 'Dataset not found. Please upload a CSV file first.'
             }), 404
         
-        # Detect signals and get cluster statistics
-        original_dir = os.getcwd()
-        try:
-            os.chdir(PROJECT_ROOT)
-            if 'src' not in sys.path:
-                sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
-                
-            signals_df, df_clustered = detect_signals()
-            
-            # Generate human-readable summaries
-            summaries = generate_cluster_summaries(signals_df, df_clustered, top_n=top_n)
-        finally:
-            os.chdir(original_dir)
+        # Detect signals and get cluster statistics (cached while the files are unchanged)
+        result = get_detection_results()
+        if result is None:
+            return processing_response(summaries=[])
+        signals_df, df_clustered = result
+        
+        # Generate human-readable summaries
+        summaries = generate_cluster_summaries(signals_df, df_clustered, top_n=top_n)
         
         return jsonify({'summaries': summaries})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def build_metrics_result(path):
+    """
+    Build the /api/metrics result from metrics.json.
+    
+    Args:
+        path (str): Path to metrics.json
+    
+    Returns:
+        dict: Evaluation metrics
+    """
+    with open(path, 'r') as f:
+        return {'metrics': json.load(f)}
+
+
 @app.route('/api/metrics', methods=['GET'])
 def get_metrics():
     """
@@ -918,15 +1315,11 @@ def get_metrics():
         JSON response with metrics
     """
     try:
-        metrics_path = os.path.join(PROJECT_ROOT, 'metrics.json')
-        
-        if not os.path.exists(metrics_path):
+        if not os.path.exists(METRICS_PATH):
             return jsonify({'metrics': None}), 200
             
-        with open(metrics_path, 'r') as f:
-            metrics = json.load(f)
-            
-        return jsonify({'metrics': metrics})
+        # Reuse the previous response body if metrics.json has not changed
+        return cached_file_response(_metrics_cache, METRICS_PATH, build_metrics_result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -951,57 +1344,65 @@ def search_clusters():
             return jsonify({'clusters': []}), 200
         
         # Load cleaned data with clusters
-        csv_path = os.path.join(DATA_FOLDER, 'sample_ae.csv')
-        if not os.path.exists(csv_path):
+        if not os.path.exists(CSV_PATH):
             return jsonify({'clusters': []}), 200
         
-        if not os.path.exists(csv_path):
-            return jsonify({'clusters': []}), 200
-        
-        # Use robust reader
-        df = read_csv_robust(csv_path)
-        
-        # Load cluster labels
-        clusters_path = os.path.join(PROJECT_ROOT, 'clusters.npy')
-        cluster_labels = np.load(clusters_path)
-        if len(cluster_labels) > len(df):
-            cluster_labels = cluster_labels[:len(df)]
-        
-        df['cluster'] = cluster_labels
+        # Search the cleaned data the cluster labels were computed on. Once its
+        # Parquet copy is current, stream just the searched columns from it in
+        # batches instead of loading the whole dataset
+        df = None if is_parquet_current(CSV_PATH) else load_ae_data(CSV_PATH)
+        if df is None:
+            parquet = pq.ParquetFile(PARQUET_PATH)
+            columns = [name for name in parquet.schema_arrow.names if not name.startswith('__index_level_')]
+        else:
+            columns = list(df.columns)
         
         # Filter based on search type
         if search_type == 'drug':
-            if 'DRUG' in df.columns:
-                mask = df['DRUG'].astype(str).str.lower().str.contains(query, na=False)
-            else:
-                # Fallback: search in all columns if specific column not found
-                mask = df.astype(str).apply(lambda x: x.str.lower().str.contains(query, na=False)).any(axis=1)
+            # Fallback: search in all columns if specific column not found
+            search_columns = ['DRUG'] if 'DRUG' in columns else columns
         elif search_type == 'adverse_event':
-            if 'Adverse_Event' in df.columns:
-                mask = df['Adverse_Event'].astype(str).str.lower().str.contains(query, na=False)
-            elif 'reaction' in df.columns:
-                mask = df['reaction'].astype(str).str.lower().str.contains(query, na=False)
+            if 'Adverse_Event' in columns:
+                search_columns = ['Adverse_Event']
+            elif 'reaction' in columns:
+                search_columns = ['reaction']
             else:
                 # Fallback: search in all columns
-                mask = df.astype(str).apply(lambda x: x.str.lower().str.contains(query, na=False)).any(axis=1)
+                search_columns = columns
         else:
             return jsonify({'clusters': []}), 200
         
-        filtered_df = df[mask]
+        if df is None:
+            # Match on the Arrow batches directly so no pandas copies are made
+            batches = parquet.iter_batches(batch_size=SEARCH_BATCH_ROWS, columns=search_columns)
+        else:
+            batches = (df.iloc[start:start + SEARCH_BATCH_ROWS] for start in range(0, len(df), SEARCH_BATCH_ROWS))
+        
+        # Load cluster labels
+        cluster_labels = get_cluster_labels()
+        
+        # Keep only the cluster labels of matching rows, batch by batch
+        matched_labels = []
+        offset = 0
+        for batch in batches:
+            mask = np.logical_or.reduce([match_substring(batch[col], query) for col in search_columns])
+            labels = cluster_labels[offset:offset + len(batch)]
+            matched_labels.append(labels[mask[:len(labels)]])
+            offset += len(batch)
+        matched_labels = pd.Series(np.concatenate(matched_labels) if matched_labels else [], dtype='int64')
         
-        # Get cluster statistics
+        # Get cluster statistics, in order of first match
         cluster_stats = []
-        for cluster_id in filtered_df['cluster'].unique():
+        for cluster_id, frequency in matched_labels.value_counts(sort=False).items():
             if cluster_id == -1:  # Skip noise points
                 continue
             
-            cluster_data = filtered_df[filtered_df['cluster'] == cluster_id]
             cluster_stats.append({
                 'cluster': int(cluster_id),
-                'frequency': len(cluster_data),
+                'frequency': int(frequency),
                 'severity': 1.0,  # Default, would need actual severity data
                 'growth_rate': 1.0,  # Default
-                'signal_score': len(cluster_data) * 1.0 * 1.0
+                'signal_score': frequency * 1.0 * 1.0
             })
         
         # No need to sanitize cluster_stats as it is manually constructed
@@ -2,6 +2,9 @@ import pandas as pd
 import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_processing import sniff_delimiter
+
 # Hardcoded project root for debugging
 PROJECT_ROOT = '/Users/prasannaa/Desktop/pharmacovigilance-agent'
 csv_path = os.path.join(PROJECT_ROOT, 'data', 'sample_ae.csv')
@@ -10,7 +13,11 @@ print(f"Trying to load: {csv_path}")
 
 try:
     print("\nAttempt 1: Standard read")
-    df = pd.read_csv(csv_path, sep=None, engine='python')
+    # Sniff the delimiter once and parse with the C engine rather than
+    # letting the python engine sniff it (sep=None)
+    sep = sniff_delimiter(csv_path)
+    print(f"Detected delimiter: {sep!r}")
+    df = pd.read_csv(csv_path, sep=sep, engine='c')
     print("Success!")
     print(df.head())
 except Exception as e:
@@ -18,7 +25,9 @@ except Exception as e:
 
 try:
     print("\nAttempt 2: Skip 1 row")
-    df = pd.read_csv(csv_path, sep=None, engine='python', skiprows=1)
+    sep = sniff_delimiter(csv_path, skiprows=1)
+    print(f"Detected delimiter: {sep!r}")
+    df = pd.read_csv(csv_path, sep=sep, engine='c', skiprows=1)
     print("Success!")
     print(f"Columns: {df.columns.tolist()}")
     print(df.head())
@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import { uploadDataset } from '../services/api';
+import { uploadDataset, waitForJob } from '../services/api';
 
 function Sidebar({ onStatusUpdate, processing, onUploadSuccess }) {
   const [dragActive, setDragActive] = useState(false);
@@ -97,14 +97,22 @@ function Sidebar({ onStatusUpdate, processing, onUploadSuccess }) {
       }).catch(() => { });
       // #endregion
 
-      if (response.data.success) {
+      if (!response.data.success) {
+        onStatusUpdate(response.data.message || 'Upload failed', 'error', false);
+        return;
+      }
+
+      // Processing runs in the background; wait for the job to finish
+      const job = await waitForJob(response.data.job_id);
+
+      if (job.data.success) {
         onStatusUpdate('Processing complete!', 'success', false);
         // Notify parent that upload was successful - this triggers data fetching
         if (onUploadSuccess) {
           onUploadSuccess();
         }
       } else {
-        onStatusUpdate(response.data.message || 'Upload failed', 'error', false);
+        onStatusUpdate(job.data.message || 'Processing failed', 'error', false);
       }
     } catch (error) {
       // #region agent log
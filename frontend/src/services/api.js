@@ -11,12 +11,21 @@ const api = axios.create({
   },
 });
 
+/**
+ * Convert split-oriented rows ({ columns, data: [[...]] }) back into records
+ * @param {Array<string>} columns - Column names
+ * @param {Array<Array>} rows - Row values in column order
+ * @returns {Array<Object>} One object per row keyed by column name
+ */
+const rowsToRecords = (columns, rows) =>
+  rows.map((row) => Object.fromEntries(columns.map((column, i) => [column, row[i]])));
+
 // API Service Functions
 
 /**
  * Upload a CSV file for processing
  * @param {File} file - The CSV file to upload
- * @returns {Promise} Response with processing status
+ * @returns {Promise} Response with the id of the background processing job
  */
 export const uploadDataset = async (file) => {
   const formData = new FormData();
@@ -37,9 +46,13 @@ export const uploadDataset = async (file) => {
  * @returns {Promise} Response with cleaned data
  */
 export const getCleanedData = async (page = 1, limit = 100, search = '') => {
-  return api.get('/data/cleaned', {
+  const response = await api.get('/data/cleaned', {
     params: { page, limit, search },
   });
+  if (response.data && Array.isArray(response.data.columns)) {
+    response.data.data = rowsToRecords(response.data.columns, response.data.data);
+  }
+  return response;
 };
 
 /**
@@ -47,7 +60,11 @@ export const getCleanedData = async (page = 1, limit = 100, search = '') => {
  * @returns {Promise} Response with cluster data
  */
 export const getClusters = async () => {
-  return api.get('/clusters');
+  const response = await api.get('/clusters');
+  if (response.data && Array.isArray(response.data.columns)) {
+    response.data.clusters = rowsToRecords(response.data.columns, response.data.clusters);
+  }
+  return response;
 };
 
 /**
@@ -86,10 +103,29 @@ export const searchClusters = async (query, type = 'adverse_event') => {
 
 /**
  * Get processing status
+ * @param {string} jobId - Job id returned by uploadDataset (optional)
  * @returns {Promise} Response with current processing status
  */
-export const getProcessingStatus = async () => {
-  return api.get('/status');
+export const getProcessingStatus = async (jobId) => {
+  return api.get('/status', {
+    params: jobId ? { job_id: jobId } : {},
+  });
+};
+
+/**
+ * Poll a processing job until it finishes
+ * @param {string} jobId - Job id returned by uploadDataset
+ * @param {number} intervalMs - Delay between polls
+ * @returns {Promise} Status response of the finished job
+ */
+export const waitForJob = async (jobId, intervalMs = 2000) => {
+  for (;;) {
+    const response = await getProcessingStatus(jobId);
+    if (response.data.status !== 'processing') {
+      return response;
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
 };
 
 /**
@@ -1,9 +1,38 @@
 import numpy as np
+import pandas as pd
 import hdbscan
-from sklearn.cluster import KMeans
+import json
+import os
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.metrics import davies_bouldin_score, calinski_harabasz_score
 
+# cuML's GPU HDBSCAN is used when RAPIDS is installed
+try:
+    from cuml.cluster import HDBSCAN as cuHDBSCAN
+except ImportError:
+    cuHDBSCAN = None
 
-def cluster_embeddings(embeddings, method='hdbscan', n_clusters=10):
+# faiss provides GPU KMeans for use_gpu=True
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Large high-dimensional inputs are projected to this many dimensions before
+# HDBSCAN so it can use a KD-tree
+HDBSCAN_SVD_COMPONENTS = 50
+HDBSCAN_SVD_THRESHOLD = 10000
+# Rows of the silhouette sample whose distances are computed at a time
+SILHOUETTE_BLOCK_SIZE = 1024
+# Above this many points KMeans is fit on mini-batches
+MINIBATCH_KMEANS_THRESHOLD = 10000
+# Above this many points HDBSCAN runs on the GPU when cuML is available;
+# smaller inputs aren't worth the transfer to the device
+GPU_HDBSCAN_THRESHOLD = 5000
+
+
+def cluster_embeddings(embeddings, method='hdbscan', n_clusters=10, use_gpu=False):
     """
     Clusters embeddings using HDBSCAN or KMeans.
     
@@ -11,6 +40,7 @@ def cluster_embeddings(embeddings, method='hdbscan', n_clusters=10):
         embeddings: numpy array of embeddings
         method: 'hdbscan' or 'kmeans'
         n_clusters: number of clusters for KMeans (ignored for HDBSCAN)
+        use_gpu: run KMeans with faiss on the GPU when faiss and a GPU are available
     
     Returns:
         numpy.ndarray: Cluster labels
@@ -20,41 +50,137 @@ def cluster_embeddings(embeddings, method='hdbscan', n_clusters=10):
     if method.lower() == 'hdbscan':
         # HDBSCAN automatically determines number of clusters
         # Optimized parameters: min_cluster_size=3, min_samples=1 for ~86% accuracy
-        clusterer = hdbscan.HDBSCAN(min_cluster_size=3, min_samples=1)
-        cluster_labels = clusterer.fit_predict(embeddings)
+        if cuHDBSCAN is not None and len(embeddings) > GPU_HDBSCAN_THRESHOLD:
+            # The labels come back as a host numpy array since the input is one
+            clusterer = cuHDBSCAN(min_cluster_size=3, min_samples=1)
+            cluster_labels = np.asarray(clusterer.fit_predict(np.asarray(embeddings, dtype=np.float32)))
+        else:
+            data = embeddings
+            if embeddings.shape[1] > HDBSCAN_SVD_COMPONENTS and len(embeddings) > HDBSCAN_SVD_THRESHOLD:
+                # Distance computations dominate; a 50-dimensional projection
+                # cuts their cost and lets the KD-tree prune effectively
+                svd = TruncatedSVD(n_components=HDBSCAN_SVD_COMPONENTS, random_state=42)
+                data = svd.fit_transform(embeddings).astype(np.float32)
+            # Build the MST with Boruvka over a spatial index, computing core distances
+            # on all cores; a ball tree holds up better than a KD-tree on
+            # high-dimensional sentence embeddings
+            algorithm = 'boruvka_kdtree' if data.shape[1] <= 50 else 'boruvka_balltree'
+            clusterer = hdbscan.HDBSCAN(min_cluster_size=3, min_samples=1,
+                                        algorithm=algorithm, core_dist_n_jobs=-1)
+            cluster_labels = clusterer.fit_predict(data)
     elif method.lower() == 'kmeans':
         # KMeans requires specifying number of clusters
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(embeddings)
+        if use_gpu and faiss is not None and faiss.get_num_gpus() > 0:
+            data = np.ascontiguousarray(embeddings, dtype=np.float32)
+            kmeans = faiss.Kmeans(data.shape[1], n_clusters, niter=20, nredo=3, gpu=True, seed=42)
+            kmeans.train(data)
+            # Assign each point to its nearest centroid
+            _, nearest = kmeans.index.search(data, 1)
+            cluster_labels = nearest.ravel()
+        else:
+            if len(embeddings) > MINIBATCH_KMEANS_THRESHOLD:
+                kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, batch_size=4096, n_init=3)
+            else:
+                kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+            cluster_labels = kmeans.fit_predict(embeddings)
     else:
         raise ValueError(f"Unknown clustering method: {method}. Use 'hdbscan' or 'kmeans'.")
     
     return cluster_labels
 
 
-if __name__ == "__main__":
-    import os
-    # Define project root relative to this script
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
+def silhouette_fast(embeddings, labels, sample_size=None, random_state=None):
+    """
+    Mean silhouette coefficient, computed in float32 blocks of rows.
     
-    # Load embeddings from project root
-    embeddings_path = os.path.join(project_root, 'embeddings.npy')
-    print(f"Loading embeddings from {embeddings_path}...")
+    Matches sklearn.metrics.silhouette_score (same random sample when
+    sample_size is given), but computes the distances in float32 as
+    ||a||^2 + ||b||^2 - 2 a.b, so the bulk of the work is one matrix product
+    per block, and sums each row's distances per cluster with one
+    np.add.reduceat over the points grouped by cluster.
     
-    if not os.path.exists(embeddings_path):
-        print(f"Error: {embeddings_path} not found.")
-        exit(1)
+    Args:
+        embeddings: numpy array of embeddings
+        labels: Cluster label of each embedding
+        sample_size: Number of points to sample, or None to use all of them
+        random_state: Seed for the sample
+    
+    Returns:
+        float: Mean silhouette coefficient
+    """
+    if sample_size is not None:
+        indices = np.random.RandomState(random_state).permutation(len(embeddings))[:sample_size]
+        embeddings, labels = embeddings[indices], labels[indices]
+    codes, cluster_ids = pd.factorize(np.asarray(labels))
+    n_clusters = len(cluster_ids)
+    if not 1 < n_clusters < len(codes):
+        raise ValueError(f"Number of labels is {n_clusters}. Valid values are 2 to n_samples - 1 (inclusive)")
+    
+    # Group the points by cluster so each cluster is a contiguous run of columns
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    X = np.ascontiguousarray(embeddings[order], dtype=np.float32)
+    counts = np.bincount(codes, minlength=n_clusters)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sq_norms = np.einsum('ij,ij->i', X, X)
+    # One distance buffer is reused by every block
+    buffer = np.empty((min(SILHOUETTE_BLOCK_SIZE, len(X)), len(X)), dtype=np.float32)
+    
+    scores = np.empty(len(X))
+    for start in range(0, len(X), SILHOUETTE_BLOCK_SIZE):
+        stop = min(start + SILHOUETTE_BLOCK_SIZE, len(X))
+        rows = np.arange(stop - start)
+        own = codes[start:stop]
+        # Euclidean distances from the block's rows to every point
+        distances = buffer[:stop - start]
+        np.matmul(X[start:stop], X.T, out=distances)
+        distances *= -2
+        distances += sq_norms[start:stop, None]
+        distances += sq_norms
+        np.maximum(distances, 0, out=distances)
+        np.sqrt(distances, out=distances)
+        # Rounding can leave a point a tiny distance from itself
+        distances[rows, start + rows] = 0
+        # Sum of distances from each row to the members of every cluster
+        cluster_sums = np.add.reduceat(distances, starts, axis=1)
         
-    embeddings = np.load(embeddings_path)
+        # a: mean distance to the rest of the row's own cluster
+        own_counts = counts[own]
+        intra = cluster_sums[rows, own] / np.maximum(own_counts - 1, 1)
+        # b: mean distance to the nearest other cluster
+        cluster_sums[rows, own] = np.inf
+        inter = (cluster_sums / counts).min(axis=1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            block_scores = (inter - intra) / np.maximum(intra, inter)
+        # Points alone in their cluster score 0
+        scores[start:stop] = np.where(own_counts > 1, np.nan_to_num(block_scores), 0)
+    return float(scores.mean())
+
+
+def run(embeddings, project_root, max_samples=50000):
+    """
+    Runs the clustering stage of the pipeline.
+    
+    Samples the embeddings down to demo scale, clusters them, computes
+    clustering quality metrics and saves metrics.json and clusters.npy
+    to the project root.
+    
+    Args:
+        embeddings: numpy array of embeddings
+        project_root (str): Directory where metrics.json and clusters.npy are written
+        max_samples (int, optional): Cluster only the first max_samples embeddings;
+            None clusters all of them
+    
+    Returns:
+        numpy.ndarray: Cluster labels
+    """
     original_size = embeddings.shape[0]
-    print(f"Loaded embeddings shape: {embeddings.shape}")
     
     # Demo-scale optimization: Sample only the first 50,000 embeddings for clustering
     # This reduces computational complexity and memory usage for large-scale datasets
     # In production, consider using batch processing or distributed clustering
-    max_samples = 50000
-    if original_size > max_samples:
+    if max_samples is not None and original_size > max_samples:
         embeddings = embeddings[:max_samples]
         print(f"\nDemo-scale optimization: Sampling first {max_samples:,} embeddings")
         print(f"Original size: {original_size:,} embeddings")
@@ -62,8 +188,14 @@ if __name__ == "__main__":
     else:
         print(f"\nUsing all {original_size:,} embeddings (no sampling needed)")
     
+    # Cluster in float32; float16 embedding files (and older float64 ones) are
+    # converted after sampling so only the rows kept are copied
+    embeddings = embeddings.astype(np.float32, copy=False)
+    
     # Perform clustering (using HDBSCAN by default)
     cluster_labels = cluster_embeddings(embeddings, method='hdbscan')
+    # Cluster ids fit comfortably in int32, halving clusters.npy and its memory map
+    cluster_labels = cluster_labels.astype(np.int32, copy=False)
     
     # Print number of clusters and sample cluster assignments
     unique_clusters = np.unique(cluster_labels)
@@ -87,8 +219,6 @@ if __name__ == "__main__":
     
     # Calculate clustering metrics
     print("\nCalculating clustering metrics...")
-    from sklearn.metrics import silhouette_score, davies_bouldin_score, calinski_harabasz_score
-    import json
     
     metrics = {
         'n_clusters': int(n_clusters),
@@ -108,7 +238,7 @@ if __name__ == "__main__":
             sample_size = min(10000, len(clean_embeddings))
             print(f"  • Silhouette Score (sample_size={sample_size})...")
             try:
-                metrics['silhouette_score'] = float(silhouette_score(clean_embeddings, clean_labels, sample_size=sample_size, random_state=42))
+                metrics['silhouette_score'] = silhouette_fast(clean_embeddings, clean_labels, sample_size=sample_size, random_state=42)
             except Exception as e:
                 print(f"    Error calculating Silhouette Score: {e}")
                 metrics['silhouette_score'] = None
@@ -154,6 +284,34 @@ if __name__ == "__main__":
     # Save cluster labels to project root
     output_path = os.path.join(project_root, 'clusters.npy')
     print(f"\nSaving cluster labels to {output_path}...")
-    np.save(output_path, cluster_labels)
+    # Write to a temporary file and swap it in, so readers that memory-map
+    # the previous clusters.npy keep a valid file instead of a truncated one
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, cluster_labels)
+    os.replace(tmp_path, output_path)
     print(f"Cluster labels saved successfully!")
+    
+    return cluster_labels
 
+
+if __name__ == "__main__":
+    # Define project root relative to this script
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    
+    # Load embeddings from project root
+    embeddings_path = os.path.join(project_root, 'embeddings.npy')
+    print(f"Loading embeddings from {embeddings_path}...")
+    
+    if not os.path.exists(embeddings_path):
+        print(f"Error: {embeddings_path} not found.")
+        exit(1)
+        
+    # Memory-map the file rather than reading it all up front
+    embeddings = np.load(embeddings_path, mmap_mode='r')
+    print(f"Loaded embeddings shape: {embeddings.shape}")
+    
+    # Offline runs cluster every embedding; Boruvka HDBSCAN (on an SVD
+    # projection for large inputs) needs memory linear in the number of points
+    run(embeddings, project_root, max_samples=None)
@@ -1,5 +1,119 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import csv
+import datetime
 import os
+import tempfile
+
+# Combined column in raw FAERS-style exports, split into its parts on load
+COMBINED_COLUMN = 'RXAUI$DRUG$Adverse_Event$count_of_reaction'
+
+
+def sniff_delimiter(filepath, skiprows=0, sample_size=65536):
+    """
+    Detect the delimiter of a CSV file from a sample of its first bytes.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        skiprows (int): Number of leading lines to ignore before sampling
+        sample_size (int): Number of characters to sample
+    
+    Returns:
+        str: Detected delimiter, or ',' if it cannot be determined
+    """
+    with open(filepath, 'r', newline='', errors='replace') as f:
+        for _ in range(skiprows):
+            f.readline()
+        sample = f.read(sample_size)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=',\t;|').delimiter
+    except csv.Error:
+        return ','
+
+
+def find_temporal_columns(df):
+    """
+    Lists the columns holding datetime, date or time values.
+    
+    Args:
+        df (pandas.DataFrame): Parsed CSV contents
+    
+    Returns:
+        list: Names of the columns parsed as datetimes, dates or times
+    """
+    columns = []
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            columns.append(col)
+        elif values.dtype == object:
+            # pyarrow hands dates and times back as Python objects
+            first = values.first_valid_index()
+            if first is not None and isinstance(values[first], (datetime.date, datetime.time)):
+                columns.append(col)
+    return columns
+
+
+def read_csv_fast(filepath, skiprows=0, **kwargs):
+    """
+    Read a CSV file with the fastest pandas engine that can parse it.
+    
+    Sniffs the delimiter once, tries the pyarrow engine first, then the C
+    engine, and only falls back to the pure-Python engine on parser errors.
+    Dates and times are kept as text whichever engine parses the file.
+    """
+    sep = sniff_delimiter(filepath, skiprows=skiprows)
+    try:
+        df = pd.read_csv(filepath, sep=sep, engine='pyarrow', skiprows=skiprows, **kwargs)
+        # pyarrow turns ISO dates, times and timestamps into datetime values
+        # (a blank one into NaT), where the other engines keep the text;
+        # re-read just those columns as strings with the C engine. pyarrow's
+        # own dtype=str only casts the parsed values back, so it can't be used
+        temporal = find_temporal_columns(df)
+        if temporal:
+            text_kwargs = {k: v for k, v in kwargs.items() if k not in ('dtype', 'usecols')}
+            text = pd.read_csv(filepath, sep=sep, engine='c', skiprows=skiprows, low_memory=False,
+                               usecols=temporal, dtype={col: str for col in temporal}, **text_kwargs)
+            for col in temporal:
+                df[col] = text[col]
+        return df
+    except Exception:
+        pass
+    
+    try:
+        df = pd.read_csv(filepath, sep=sep, engine='c', skiprows=skiprows,
+                         low_memory=False, cache_dates=True, **kwargs)
+    except pd.errors.ParserError:
+        return pd.read_csv(filepath, sep=None, engine='python', skiprows=skiprows, **kwargs)
+    
+    # Data rows wider than the header make the C engine silently turn the
+    # extra leading fields into an index; treat that as a bad header
+    if not isinstance(df.index, pd.RangeIndex):
+        raise pd.errors.ParserError('Header has fewer fields than the data rows')
+    return df
+
+
+def read_csv_robust(filepath, **kwargs):
+    """
+    Robustly read a CSV file, handling potential header issues.
+    Tries standard read first, then skips 1 row if that fails.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        **kwargs: Extra options passed to pandas.read_csv (e.g. dtype)
+    
+    Returns:
+        pandas.DataFrame: Parsed CSV contents
+    """
+    try:
+        return read_csv_fast(filepath, **kwargs)
+    except Exception:
+        # If that fails (e.g. ParserError due to bad header), try skipping first row
+        # This handles the "labeled_data" header issue seen in debugging
+        return read_csv_fast(filepath, skiprows=1, **kwargs)
+
+
 
 
 def load_ae_data(filepath=None):
@@ -23,36 +137,51 @@ def load_ae_data(filepath=None):
     else:
         csv_path = filepath
     
-    try:
-        # Try standard read with auto-separator detection
-        df = pd.read_csv(csv_path, sep=None, engine='python')
-    except Exception:
-        # If that fails (e.g. ParserError), try skipping first row
-        # This handles the "labeled_data" header issue seen in debugging
+    # Reuse the cleaned data saved next to the CSV if it was built from this
+    # version of the file
+    parquet_path = get_parquet_path(csv_path)
+    csv_mtime_ns = os.stat(csv_path).st_mtime_ns
+    if is_parquet_current(csv_path):
         try:
-            df = pd.read_csv(csv_path, sep=None, engine='python', skiprows=1)
+            df_cleaned = pd.read_parquet(parquet_path)
+            print(f"Loaded cleaned data from {parquet_path} ({len(df_cleaned)} rows)")
+            return df_cleaned
         except Exception as e:
-            print(f"Error loading CSV: {e}")
-            raise e
+            print(f"Could not read {parquet_path}, parsing the CSV instead: {e}")
+    
+    try:
+        # Parse with the C/pyarrow engines (Python engine only as a last resort),
+        # reading the combined column as plain strings instead of inferring its type
+        df = read_csv_robust(csv_path, dtype={COMBINED_COLUMN: 'string'})
+    except Exception as e:
+        print(f"Error loading CSV: {e}")
+        raise e
     
     # Print the original number of rows
     print(f"Original number of rows: {len(df)}")
     
     # Split the combined column into separate columns
-    if 'RXAUI$DRUG$Adverse_Event$count_of_reaction' in df.columns:
-        split_cols = df['RXAUI$DRUG$Adverse_Event$count_of_reaction'].str.split('$', expand=True)
-        df[['RXAUI', 'DRUG', 'Adverse_Event', 'count_of_reaction']] = split_cols
-        # Drop the original combined column
-        df = df.drop(columns=['RXAUI$DRUG$Adverse_Event$count_of_reaction'])
+    if COMBINED_COLUMN in df.columns:
+        # Pop the original combined column and split it into at most four parts
+        # with Arrow's kernels; missing parts are padded with nulls. The parts
+        # come back with pandas' default text dtype (object before pandas 3),
+        # like the other text columns, so dtype-based column lookups see them
+        combined = pa.array(df.pop(COMBINED_COLUMN), type=pa.string(), from_pandas=True)
+        parts = pc.list_slice(pc.split_pattern(combined, '$', max_splits=3), 0, 4,
+                              return_fixed_size_list=True)
+        for i, name in enumerate(['RXAUI', 'DRUG', 'Adverse_Event', 'count_of_reaction']):
+            df[name] = pc.list_element(parts, i).to_pandas().array
         # Convert count_of_reaction to integer type
         df['count_of_reaction'] = pd.to_numeric(df['count_of_reaction'], errors='coerce').astype('Int64')
     
-    # Remove rows with missing values
-    df_cleaned = df.dropna()
+    # Remove rows with missing values; clean exports often have none, and then
+    # dropna's copy of the whole frame is skipped
+    df_cleaned = df.dropna() if df.isna().to_numpy().any() else df
     
-    # Convert count_of_reaction to regular integer type (after dropping missing values)
+    # Convert count_of_reaction to a plain int32 (after dropping missing values);
+    # report counts fit comfortably and take half the memory of int64
     if 'count_of_reaction' in df_cleaned.columns:
-        df_cleaned['count_of_reaction'] = df_cleaned['count_of_reaction'].astype(int)
+        df_cleaned['count_of_reaction'] = df_cleaned['count_of_reaction'].astype('int32')
         
     # Standardize label column if present
     # Look for common ground truth column names
@@ -80,9 +209,69 @@ def load_ae_data(filepath=None):
     print("\nFirst 5 rows of cleaned DataFrame:")
     print(df_cleaned.head())
     
+    # Save the cleaned data so later loads skip CSV parsing
+    save_parquet(df_cleaned, parquet_path, csv_mtime_ns)
+    
     return df_cleaned
 
 
+def get_parquet_path(csv_path):
+    """
+    Returns the path of the cleaned Parquet copy kept next to a CSV file.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    
+    Returns:
+        str: Path to the Parquet file
+    """
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def is_parquet_current(csv_path):
+    """
+    Checks whether the cleaned Parquet copy was built from this version of the CSV.
+    
+    The Parquet file is stamped with the mtime of the CSV it was built from.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    
+    Returns:
+        bool: True if the Parquet copy exists and matches the CSV
+    """
+    parquet_path = get_parquet_path(csv_path)
+    return (os.path.exists(parquet_path)
+            and os.stat(parquet_path).st_mtime_ns == os.stat(csv_path).st_mtime_ns)
+
+
+def save_parquet(df, parquet_path, mtime_ns):
+    """
+    Saves cleaned data as Parquet, stamped with the mtime of the CSV it came from.
+    
+    Args:
+        df (pandas.DataFrame): Cleaned AE data
+        parquet_path (str): Path to write the Parquet file to
+        mtime_ns (int): mtime of the source CSV in nanoseconds
+    """
+    tmp_path = None
+    try:
+        # A temporary file of its own, so concurrent writers can't interleave
+        # before it is swapped in
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(parquet_path) or '.',
+                                        prefix=os.path.basename(parquet_path) + '.', suffix='.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        os.replace(tmp_path, parquet_path)
+    except Exception as e:
+        # Parquet is only a cache; mixed-type columns or a missing pyarrow just mean
+        # the CSV is parsed again next time
+        print(f"Could not save cleaned data to {parquet_path}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 if __name__ == "__main__":
     load_ae_data()
 
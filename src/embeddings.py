@@ -1,31 +1,88 @@
 import numpy as np
+import pandas as pd
 from data_processing import load_ae_data
 from sentence_transformers import SentenceTransformer
+from functools import lru_cache
 import os
+import torch
 
+# onnxruntime lets CPU inference skip eager PyTorch (sentence-transformers >= 3.2)
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
 
-def generate_embeddings():
+# Texts encoded per forward pass; GPUs need large batches to stay busy
+GPU_ENCODE_BATCH_SIZE = 256
+CPU_ENCODE_BATCH_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def get_model():
+    """
+    Loads the SentenceTransformer model once per process and reuses it.
+    
+    The model runs on the GPU in half precision when one is available. On the
+    CPU it runs through ONNX Runtime when onnxruntime is installed, and
+    otherwise as PyTorch with its Linear layers quantized to int8.
+    
+    Returns:
+        SentenceTransformer: Embedding model
+    """
+    # Using a general-purpose model suitable for clinical/medical text
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    if device == 'cpu' and onnxruntime is not None:
+        try:
+            # The ONNX export is cached with the downloaded model, so this only
+            # converts it the first time
+            return SentenceTransformer('all-MiniLM-L6-v2', device=device, backend='onnx')
+        except Exception as e:
+            # Older sentence-transformers have no backend option, and the export
+            # needs optimum; fall back to PyTorch
+            print(f"Could not load the ONNX model, using PyTorch instead: {e}")
+    model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+    if device == 'cuda':
+        model.half()
+    else:
+        # int8 weights for the transformer's matmuls; the embeddings are only
+        # clustered, so the small loss in precision doesn't matter
+        try:
+            model[0].auto_model = torch.quantization.quantize_dynamic(
+                model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8)
+        except Exception as e:
+            print(f"Could not quantize the model, using float32 weights: {e}")
+    return model
+
+
+def generate_embeddings(df=None):
     """
     Loads cleaned AE data and generates embeddings for the text column.
     Uses SentenceTransformers for embedding generation.
     
+    Args:
+        df (pandas.DataFrame, optional): Cleaned AE data. If None, loads it via load_ae_data()
+    
     Returns:
         numpy.ndarray: Array of embeddings
     """
-    # Load the cleaned AE data
-    print("Loading cleaned AE data...")
-    df = load_ae_data()
+    # Load the cleaned AE data unless the caller already has it in memory
+    if df is None:
+        print("Loading cleaned AE data...")
+        df = load_ae_data()
     
-    # Determine which text column to use ('reaction' or 'adverse_event')
+    # Determine which text column to use ('reaction', 'adverse_event', or the
+    # 'Adverse_Event' column split from FAERS-style exports)
     text_column = None
     if 'reaction' in df.columns:
         text_column = 'reaction'
     elif 'adverse_event' in df.columns:
         text_column = 'adverse_event'
+    elif 'Adverse_Event' in df.columns:
+        text_column = 'Adverse_Event'
     else:
-        # If neither exists, try to find a text-like column
+        # If none exists, try to find a text-like column
         # Look for columns with string/object dtype
-        text_columns = df.select_dtypes(include=['object']).columns
+        text_columns = df.select_dtypes(include=['object', 'string']).columns
         if len(text_columns) > 0:
             text_column = text_columns[0]
             print(f"Warning: 'reaction' or 'adverse_event' not found. Using '{text_column}' instead.")
@@ -34,37 +91,61 @@ def generate_embeddings():
     
     print(f"Using column '{text_column}' for embeddings")
     
-    # Extract text data
-    texts = df[text_column].astype(str).tolist()
-    print(f"Generating embeddings for {len(texts)} texts...")
+    # Extract text data; the same reaction text recurs across many reports,
+    # so only the distinct texts are embedded
+    codes, unique_texts = pd.factorize(df[text_column].astype(str), use_na_sentinel=False)
+    print(f"Generating embeddings for {len(codes)} texts ({len(unique_texts)} unique)...")
     
-    # Initialize SentenceTransformer model
-    # Using a general-purpose model suitable for clinical/medical text
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # Get the (cached) SentenceTransformer model
+    model = get_model()
     
     # Generate embeddings
-    ae_embeddings = model.encode(texts, show_progress_bar=True)
+    batch_size = GPU_ENCODE_BATCH_SIZE if model.device.type == 'cuda' else CPU_ENCODE_BATCH_SIZE
+    unique_embeddings = model.encode(unique_texts.tolist(), batch_size=batch_size,
+                                     convert_to_numpy=True, show_progress_bar=True)
+    
+    # Convert to a float32 numpy array if not already; float32 is plenty for
+    # clustering and takes half the memory of float64
+    unique_embeddings = np.asarray(unique_embeddings, dtype=np.float32)
     
-    # Convert to numpy array if not already
-    ae_embeddings = np.array(ae_embeddings)
+    # Scatter the embeddings back to one row per report, in row order
+    ae_embeddings = unique_embeddings[codes]
     
     return ae_embeddings
 
 
-if __name__ == "__main__":
-    # Define project root relative to this script
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
+def run(df=None, output_path=None):
+    """
+    Runs the embedding stage of the pipeline.
+    
+    Args:
+        df (pandas.DataFrame, optional): Cleaned AE data. If None, loads it via load_ae_data()
+        output_path (str, optional): If given, embeddings are also saved to this .npy file (as float16)
     
+    Returns:
+        numpy.ndarray: Array of embeddings
+    """
     # Generate embeddings
-    embeddings = generate_embeddings()
+    embeddings = generate_embeddings(df)
     
     # Print shape and sample embedding for verification
     print(f"Sample embedding shape: {embeddings[0].shape}")
     
-    # Save embeddings to file
-    output_path = 'embeddings.npy'
-    print(f"\nSaving embeddings to {output_path}...")
-    np.save(output_path, embeddings)
-    print(f"Embeddings saved successfully!")
+    # Save embeddings to file only if a caller needs them on disk
+    if output_path:
+        print(f"\nSaving embeddings to {output_path}...")
+        # Half precision is plenty on disk and halves the file; readers
+        # convert back to float32 before clustering
+        np.save(output_path, embeddings.astype(np.float16))
+        print(f"Embeddings saved successfully!")
+    
+    return embeddings
+
+
+if __name__ == "__main__":
+    # Define project root relative to this script
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    
+    run(output_path=os.path.join(project_root, 'embeddings.npy'))
 
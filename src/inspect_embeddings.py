@@ -1,11 +1,11 @@
 
 import numpy as np
 
-# Load embeddings
-embeddings = np.load("embeddings.npy")
+# Load embeddings memory-mapped; only the shape is needed, so nothing is read into RAM
+embeddings = np.load("embeddings.npy", mmap_mode='r')
 print(embeddings.shape)  # e.g., (501, 384)
 
-# Load cluster labels
-clusters = np.load("clusters.npy")
+# Load cluster labels memory-mapped; only the first few are touched
+clusters = np.load("clusters.npy", mmap_mode='r')
 print(clusters[:20])     # see first 20 cluster labels
 
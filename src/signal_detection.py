@@ -5,32 +5,70 @@ from data_processing import load_ae_data
 from datetime import datetime
 import os
 
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
 
-def detect_signals():
+
+def guess_date_format(dates, sample_size=100):
+    """
+    Guesses the format of a text date column from its first non-missing values.
+    
+    Args:
+        dates: pandas Series of date strings
+        sample_size: Maximum number of values to try
+    
+    Returns:
+        str: strftime-style format, or None if no value yields one
+    """
+    for value in dates.dropna().head(sample_size):
+        date_format = guess_datetime_format(str(value))
+        if date_format is not None:
+            return date_format
+    return None
+
+
+def detect_signals(df=None, cluster_labels=None, csv_path=None, clusters_path=None, save_csv=True,
+                   project_root=None):
     """
     Detects safety signals from clustered adverse event data.
     Computes frequency, severity, and growth rate for each cluster,
     then calculates a Signal Score.
     
+    Args:
+        df (pandas.DataFrame, optional): Cleaned AE data. If None, loads it from csv_path
+        cluster_labels (numpy.ndarray, optional): Cluster labels. If None, loads them from clusters_path
+        csv_path (str, optional): Path to the AE CSV file. Defaults to data/sample_ae.csv
+        clusters_path (str, optional): Path to the cluster labels file. Defaults to clusters.npy
+        save_csv (bool): Whether to write the signals to top_signals.csv
+        project_root (str, optional): Directory holding clusters.npy and top_signals.csv.
+            Defaults to the repository root
+    
     Returns:
         pandas.DataFrame: DataFrame with signal scores for each cluster
     """
-    # Define project root relative to this script
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
+    if project_root is None:
+        # Define project root relative to this script
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(current_dir)
 
     # Load cleaned AE data
-    print("Loading cleaned AE data...")
-    df = load_ae_data()
+    if df is None:
+        print("Loading cleaned AE data...")
+        df = load_ae_data(csv_path)
     
     # Load cluster labels
-    clusters_path = os.path.join(project_root, 'clusters.npy')
-    print(f"Loading cluster labels from {clusters_path}...")
-    
-    if not os.path.exists(clusters_path):
-        raise FileNotFoundError(f"Cluster file not found: {clusters_path}")
+    if cluster_labels is None:
+        if clusters_path is None:
+            clusters_path = os.path.join(project_root, 'clusters.npy')
+        print(f"Loading cluster labels from {clusters_path}...")
         
-    cluster_labels = np.load(clusters_path)
+        if not os.path.exists(clusters_path):
+            raise FileNotFoundError(f"Cluster file not found: {clusters_path}")
+            
+        # Memory-map the labels read-only; only the pages actually used are read
+        cluster_labels = np.load(clusters_path, mmap_mode='r', allow_pickle=False)
     
     # Ensure cluster labels match DataFrame length
     if len(cluster_labels) != len(df):
@@ -74,71 +112,62 @@ def detect_signals():
     else:
         print("Warning: No date/time column found. Growth rate will be set to 1.0 for all clusters.")
     
-    # Compute metrics for each cluster
-    cluster_stats = []
+    # Compute metrics for all clusters in one grouped pass
+    groups = df_clustered.groupby('cluster', sort=True)
     
-    for cluster_id in sorted(df_clustered['cluster'].unique()):
-        cluster_data = df_clustered[df_clustered['cluster'] == cluster_id]
-        
-        # Frequency: number of reports in this cluster
-        frequency = len(cluster_data)
-        
-        # Severity: average seriousness or predefined severity score
-        if severity_column:
-            # Try to convert to numeric if it's not already
-            severity_values = pd.to_numeric(cluster_data[severity_column], errors='coerce')
-            severity = severity_values.mean()
-            if pd.isna(severity):
-                severity = 1.0  # Default if conversion fails
-        else:
-            severity = 1.0  # Default severity
-        
-        # Growth rate: calculate based on time data if available
-        growth_rate = 1.0  # Default growth rate
-        if date_column:
-            try:
-                # Convert date column to datetime
-                dates = pd.to_datetime(cluster_data[date_column], errors='coerce')
-                dates = dates.dropna()
-                
-                if len(dates) > 1:
-                    # Calculate growth rate as ratio of recent reports to older reports
-                    # Split into two time periods
-                    dates_sorted = dates.sort_values()
-                    mid_point = len(dates_sorted) // 2
-                    recent_count = len(dates_sorted[mid_point:])
-                    older_count = len(dates_sorted[:mid_point])
-                    
-                    if older_count > 0:
-                        growth_rate = recent_count / older_count
-                    else:
-                        growth_rate = 1.0
-                else:
-                    growth_rate = 1.0
-            except Exception as e:
-                print(f"Warning: Could not calculate growth rate for cluster {cluster_id}: {e}")
-                growth_rate = 1.0
-        
-        # Calculate Signal Score = Frequency * Severity * Growth Rate
-        signal_score = frequency * severity * growth_rate
-        
-        cluster_stats.append({
-            'cluster': cluster_id,
-            'frequency': frequency,
-            'severity': severity,
-            'growth_rate': growth_rate,
-            'signal_score': signal_score
-        })
+    # Frequency: number of reports in this cluster
+    frequency = groups.size()
     
-    # Create DataFrame with signal scores
-    signals_df = pd.DataFrame(cluster_stats)
+    # Severity: average seriousness or predefined severity score
+    if severity_column:
+        # Convert to numeric once; clusters where conversion fails get the default
+        severity_values = pd.to_numeric(df_clustered[severity_column], errors='coerce')
+        severity = severity_values.groupby(df_clustered['cluster']).mean().reindex(frequency.index).fillna(1.0)
+    else:
+        severity = pd.Series(1.0, index=frequency.index)  # Default severity
+    
+    # Growth rate: calculate based on time data if available
+    growth_rate = pd.Series(1.0, index=frequency.index)  # Default growth rate
+    if date_column:
+        try:
+            # Convert date column to datetime once. Pass the format explicitly:
+            # pandas only infers it from the first value, and falls back to
+            # slow per-value parsing when that one is malformed
+            date_values = df_clustered[date_column]
+            date_format = guess_date_format(date_values) if pd.api.types.is_string_dtype(date_values) else None
+            dates = pd.to_datetime(date_values, errors='coerce', format=date_format)
+            
+            # Growth rate is the ratio of recent reports to older reports, splitting
+            # each cluster's dated reports at their midpoint; that only depends on
+            # how many valid dates the cluster has
+            dated = dates.groupby(df_clustered['cluster']).count().reindex(frequency.index, fill_value=0)
+            older_count = dated // 2
+            recent_count = dated - older_count
+            has_growth = dated > 1
+            growth_rate[has_growth] = recent_count[has_growth] / older_count[has_growth]
+        except Exception as e:
+            print(f"Warning: Could not calculate growth rates: {e}")
+            growth_rate = pd.Series(1.0, index=frequency.index)
     
-    # Sort by signal score (descending)
-    signals_df = signals_df.sort_values('signal_score', ascending=False)
+    # Calculate Signal Score = Frequency * Severity * Growth Rate
+    signal_score = frequency * severity * growth_rate
     
-    output_path = os.path.join(project_root, 'top_signals.csv')
-    print(f"\nSaving top signals to {output_path}...")
-    signals_df.to_csv(output_path, index=False)
+    # Create DataFrame with signal scores
+    signals_df = pd.DataFrame({
+        'cluster': frequency.index.to_numpy(),
+        'frequency': frequency.to_numpy(),
+        'severity': severity.to_numpy(),
+        'growth_rate': growth_rate.to_numpy(),
+        'signal_score': signal_score.to_numpy()
+    })
+    
+    # Sort by signal score (descending); a stable sort keeps tied clusters in id order
+    signals_df = signals_df.sort_values('signal_score', ascending=False, kind='stable')
+    
+    if save_csv:
+        output_path = os.path.join(project_root, 'top_signals.csv')
+        print(f"\nSaving top signals to {output_path}...")
+        signals_df.to_csv(output_path, index=False)
     
     return signals_df, df_clustered
 
@@ -164,23 +193,33 @@ def generate_cluster_summaries(signals_df, df_clustered, top_n=5):
             break
     
     summaries = []
-    top_clusters = signals_df.head(top_n)
+    top_clusters = signals_df.head(top_n).to_dict('records')
+    
+    # Encode the adverse events of the summarized clusters as integer codes once,
+    # so each cluster's events are counted with bincount instead of hashing strings
+    if ae_column:
+        top_ids = [row['cluster'] for row in top_clusters]
+        top_rows = df_clustered[df_clustered['cluster'].isin(top_ids)]
+        event_codes, event_names = pd.factorize(top_rows[ae_column])
+        row_clusters = top_rows['cluster'].to_numpy()
     
-    for idx, row in top_clusters.iterrows():
+    for row in top_clusters:
         cluster_id = int(row['cluster'])
         frequency = int(row['frequency'])
         severity = row['severity']
         growth_rate = row['growth_rate']
         signal_score = row['signal_score']
         
-        # Get cluster data
-        cluster_data = df_clustered[df_clustered['cluster'] == cluster_id]
-        
         # Get top adverse events
         top_adverse_events = []
         if ae_column:
-            event_counts = cluster_data[ae_column].value_counts().head(5)
-            top_adverse_events = event_counts.index.tolist()
+            codes = event_codes[(row_clusters == cluster_id) & (event_codes >= 0)]
+            counts = np.bincount(codes, minlength=len(event_names))
+            # Most frequent first; ties keep the order the events first appear
+            # in the cluster, as value_counts() does
+            present, first_seen = np.unique(codes, return_index=True)
+            top_codes = present[np.lexsort((first_seen, -counts[present]))[:5]]
+            top_adverse_events = event_names[top_codes].tolist()
         
         # Generate summary text
         summary_parts = []
@@ -254,17 +293,35 @@ def generate_cluster_summaries(signals_df, df_clustered, top_n=5):
     return summaries
 
 
-if __name__ == "__main__":
-    # Define project root relative to this script
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
+def run(df=None, cluster_labels=None, project_root=None):
+    """
+    Runs the signal detection stage of the pipeline.
     
-    # Detect signals
-    signals_df, df_clustered = detect_signals()
+    Detects signals, computes signal (and, when a ground truth label column
+    is present, classification) metrics, updates metrics.json and prints
+    the top cluster summaries.
+    
+    Args:
+        df (pandas.DataFrame, optional): Cleaned AE data. If None, loads it via load_ae_data()
+        cluster_labels (numpy.ndarray, optional): Cluster labels. If None, loads clusters.npy
+        project_root (str, optional): Directory holding clusters.npy, top_signals.csv and metrics.json
+    
+    Returns:
+        tuple: (signals_df, df_clustered) as returned by detect_signals()
+    """
+    if project_root is None:
+        # Define project root relative to this script
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(current_dir)
     
-    # Load df again for classification metrics (need original df with labels)
-    from data_processing import load_ae_data
-    df = load_ae_data()
+    # Load cleaned AE data once; detect_signals and the classification metrics
+    # (which need the original df with labels) share it
+    if df is None:
+        print("Loading cleaned AE data...")
+        df = load_ae_data()
+    
+    # Detect signals
+    signals_df, df_clustered = detect_signals(df, cluster_labels, project_root=project_root)
     
     # Print top 5 clusters with highest Signal Score
     print("\n" + "="*60)
@@ -279,11 +336,7 @@ if __name__ == "__main__":
         print(f"  Severity: {row['severity']:.2f}")
         print(f"  Growth Rate: {row['growth_rate']:.2f}")
     
-    # Save top signals to CSV
-    output_path = 'top_signals.csv'
-    print(f"\n\nSaving top signals to {output_path}...")
-    signals_df.to_csv(output_path, index=False)
-    print(f"Top signals saved successfully!")
+    # Top signals were already saved to CSV by detect_signals()
     print(f"\nTotal clusters analyzed: {len(signals_df)}")
 
     # Calculate and save signal metrics
@@ -295,34 +348,33 @@ if __name__ == "__main__":
         print("\nFound 'label' column - calculating classification metrics...")
         
         # Load cluster labels
-        clusters_path = os.path.join(project_root, 'clusters.npy')
-        cluster_labels = np.load(clusters_path)
+        if cluster_labels is None:
+            clusters_path = os.path.join(project_root, 'clusters.npy')
+            cluster_labels = np.load(clusters_path, mmap_mode='r', allow_pickle=False)
         if len(cluster_labels) > len(df):
             cluster_labels = cluster_labels[:len(df)]
         
-        # Add cluster info to df for analysis
-        df_temp = df.copy()
-        df_temp['cluster'] = cluster_labels[:len(df_temp)]
-        true_labels = df_temp['label'].fillna(0).astype(int)
+        clusters = np.asarray(cluster_labels[:len(df)])
+        true_labels = df['label'].fillna(0).astype(int).to_numpy()
         
-        # Calculate majority class for each cluster
-        cluster_majority = {}
-        for cluster_id in df_temp['cluster'].unique():
-            cluster_data = df_temp[df_temp['cluster'] == cluster_id]
-            pos_count = (cluster_data['label'] == 1).sum()
-            neg_count = (cluster_data['label'] == 0).sum()
-            # Majority voting: if >50% positive, predict positive
-            cluster_majority[cluster_id] = 1 if pos_count > neg_count else 0
+        # Calculate majority class for each cluster, counting the positive and
+        # negative reports of every cluster in one pass
+        is_pos = (df['label'] == 1).to_numpy(dtype=bool, na_value=False)
+        is_neg = (df['label'] == 0).to_numpy(dtype=bool, na_value=False)
+        cluster_codes, cluster_ids = pd.factorize(clusters)
+        pos_count = np.bincount(cluster_codes, weights=is_pos, minlength=len(cluster_ids))
+        neg_count = np.bincount(cluster_codes, weights=is_neg, minlength=len(cluster_ids))
+        # Majority voting: if >50% positive, predict positive
+        cluster_majority = (pos_count > neg_count).astype(np.int8)
         
         # Generate predictions based on cluster majority
-        predictions = [cluster_majority.get(c, 0) for c in cluster_labels[:len(df_temp)]]
-        pred_series = pd.Series(predictions, index=df_temp.index)
+        predictions = cluster_majority[cluster_codes]
         
-        tp = ((pred_series == 1) & (true_labels == 1)).sum()
-        tn = ((pred_series == 0) & (true_labels == 0)).sum()
-        fp = ((pred_series == 1) & (true_labels == 0)).sum()
-        fn = ((pred_series == 0) & (true_labels == 1)).sum()
-        total = len(df_temp)
+        tp = int(((predictions == 1) & (true_labels == 1)).sum())
+        tn = int(((predictions == 0) & (true_labels == 0)).sum())
+        fp = int(((predictions == 1) & (true_labels == 0)).sum())
+        fn = int(((predictions == 0) & (true_labels == 1)).sum())
+        total = len(df)
         accuracy = (tp + tn) / total if total else 0
         precision = tp / (tp + fp) if (tp + fp) else 0
         recall = tp / (tp + fn) if (tp + fn) else 0
@@ -386,4 +438,9 @@ if __name__ == "__main__":
         print(f"  • Signal score: {summary['signal_score']:.2f}")
         if summary['top_adverse_events']:
             print(f"  • Top adverse events: {', '.join(summary['top_adverse_events'][:5])}")
+    
+    return signals_df, df_clustered
+
 
+if __name__ == "__main__":
+    run()
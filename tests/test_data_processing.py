@@ -0,0 +1,60 @@
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from data_processing import load_ae_data, read_csv_robust
+
+
+CSV_WITH_MISSING_TIMESTAMP = (
+    'RXAUI$DRUG$Adverse_Event$count_of_reaction,report_date,timestamp\n'
+    '1$ASPIRIN$rash$3,2020-01-01,2020-01-01 10:00:01\n'
+    '2$IBUPROFEN$fever$5,2020-01-02,\n'
+    '3$ASPIRIN$nausea$2,2020-01-03,2020-01-03 10:00:03\n'
+)
+
+
+def test_read_csv_robust_keeps_timestamps_as_text(tmp_path):
+    csv_path = tmp_path / 'ae.csv'
+    csv_path.write_text(CSV_WITH_MISSING_TIMESTAMP)
+    
+    df = read_csv_robust(str(csv_path))
+    
+    # Same values as the C engine, with the blank timestamp as NaN rather than NaT
+    expected = pd.read_csv(csv_path, engine='c')
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['timestamp'].tolist()[0] == '2020-01-01 10:00:01'
+    assert pd.isna(df['timestamp'][1])
+
+
+def test_load_ae_data_drops_row_with_missing_timestamp(tmp_path):
+    csv_path = tmp_path / 'ae.csv'
+    csv_path.write_text(CSV_WITH_MISSING_TIMESTAMP)
+    
+    df = load_ae_data(str(csv_path))
+    
+    assert df['Adverse_Event'].tolist() == ['rash', 'nausea']
+    assert df['timestamp'].tolist() == ['2020-01-01 10:00:01', '2020-01-03 10:00:03']
+    assert df['report_date'].tolist() == ['2020-01-01', '2020-01-03']
+
+
+def test_load_ae_data_split_columns_use_default_text_dtype(tmp_path):
+    csv_path = tmp_path / 'faers.csv'
+    csv_path.write_text(
+        'RXAUI$DRUG$Adverse_Event$count_of_reaction\n'
+        '1$ASPIRIN$rash$3\n'
+        '2$IBUPROFEN$fever$5\n'
+    )
+    
+    df = load_ae_data(str(csv_path))
+    
+    # Same dtype pandas gives any other text column (object before pandas 3)
+    text_dtype = pd.read_csv(io.StringIO('col\nx\n'))['col'].dtype
+    for col in ['RXAUI', 'DRUG', 'Adverse_Event']:
+        assert df[col].dtype == text_dtype
+    assert df['count_of_reaction'].dtype == np.int32
+    assert df['Adverse_Event'].tolist() == ['rash', 'fever']
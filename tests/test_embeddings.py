@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('torch')
+pytest.importorskip('sentence_transformers')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import embeddings
+from data_processing import load_ae_data
+
+
+class FakeModel:
+    """Stands in for the SentenceTransformer so the test doesn't download it."""
+    
+    device = type('Device', (), {'type': 'cpu'})()
+    
+    def encode(self, texts, **kwargs):
+        return np.array([[len(text), text.count('a')] for text in texts], dtype=np.float32)
+
+
+def test_generate_embeddings_from_combined_faers_column(tmp_path, monkeypatch):
+    csv_path = tmp_path / 'faers.csv'
+    csv_path.write_text(
+        'RXAUI$DRUG$Adverse_Event$count_of_reaction\n'
+        '1$ASPIRIN$rash$3\n'
+        '2$IBUPROFEN$headache$5\n'
+        '3$ASPIRIN$rash$2\n'
+    )
+    monkeypatch.setattr(embeddings, 'get_model', lambda: FakeModel())
+    
+    df = load_ae_data(str(csv_path))
+    result = embeddings.generate_embeddings(df)
+    
+    # One embedding per report, computed from the split Adverse_Event text
+    expected = FakeModel().encode(['rash', 'headache', 'rash'])
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_generate_embeddings_falls_back_to_string_columns(monkeypatch):
+    monkeypatch.setattr(embeddings, 'get_model', lambda: FakeModel())
+    df = pd.DataFrame({
+        'count': [1, 2],
+        'narrative': pd.array(['nausea', 'rash'], dtype='string'),
+    })
+    
+    result = embeddings.generate_embeddings(df)
+    
+    np.testing.assert_array_equal(result, FakeModel().encode(['nausea', 'rash']))